@@ -47,7 +47,7 @@ def main():
     parser.add_argument("--no-manual", action="store_true", help="Disable manual login")
     parser.add_argument("--no-resume", action="store_true", help="Disable resume functionality (process all conversations)")
     parser.add_argument("--reset-progress", action="store_true", help="Reset progress tracking")
-    parser.add_argument("--progress-file", default="data/scraper_progress.json", help="Progress tracking file")
+    parser.add_argument("--progress-file", default="data/scraper_progress.jsonl", help="Progress tracking file")
     
     args = parser.parse_args()
     
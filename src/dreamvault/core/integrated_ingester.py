@@ -20,6 +20,7 @@ from .schema import SummarySchema
 
 logger = logging.getLogger(__name__)
 
+
 class IntegratedIngester:
     """
     Integrated ingester that processes conversations immediately.
@@ -456,6 +457,8 @@ class IntegratedIngester:
                                     training_success: bool) -> bool:
         """Store processed conversation data in database."""
         try:
+            from ..resurrection.ip_extractor import json_default
+            
             with sqlite3.connect(self.db_path) as conn:
                 cursor = conn.cursor()
                 
@@ -508,11 +511,11 @@ class IntegratedIngester:
                         ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
                     """, (
                         conversation_id,
-                        json.dumps(ip_data.get("product_ideas", [])),
-                        json.dumps(ip_data.get("workflows", [])),
-                        json.dumps(ip_data.get("brand_names", [])),
-                        json.dumps(ip_data.get("schemas", [])),
-                        json.dumps(ip_data.get("abandoned_ideas", [])),
+                        json.dumps(ip_data.get("product_ideas", []), default=json_default),
+                        json.dumps(ip_data.get("workflows", []), default=json_default),
+                        json.dumps(ip_data.get("brand_names", []), default=json_default),
+                        json.dumps(ip_data.get("schemas", []), default=json_default),
+                        json.dumps(ip_data.get("abandoned_ideas", []), default=json_default),
                         ip_data.get("potential_value", 0.0),
                         json.dumps(ip_data.get("tags", [])),
                         ip_data.get("summary", ""),
@@ -4,14 +4,75 @@ Deployment Configuration for DreamVault Agent Deployment
 Manages deployment settings and configuration.
 """
 
-import json
+import copy
 import logging
+import re
+from contextlib import contextmanager
+from decimal import Decimal
 from pathlib import Path
-from typing import Dict, Any, Optional
-from datetime import datetime
+from types import MappingProxyType
+from typing import Dict, Any, Mapping, Optional, Union
+from datetime import date, datetime
+
+from ..utils import jsonio
 
 logger = logging.getLogger(__name__)
 
+# Human-readable size strings such as "10MB", "512 KB" or "512k"
+_SIZE_RE = re.compile(r'^\s*(\d+(?:\.\d+)?)\s*([KMGT]?)B?\s*$', re.I)
+_SIZE_UNITS = {'': 1, 'K': 1024, 'M': 1024 ** 2, 'G': 1024 ** 3, 'T': 1024 ** 4}
+
+# Size settings parsed to integers at load time, keyed by their byte accessor name
+_SIZE_KEYS = {
+    'security.max_request_size_bytes': 'security.max_request_size',
+    'logging.max_file_size_bytes': 'logging.max_file_size',
+}
+
+
+def _parse_size(size: Union[str, int]) -> int:
+    """
+    Parse a human-readable size into bytes.
+    
+    Args:
+        size: Size string (e.g. "10MB") or integer byte count
+        
+    Returns:
+        Size in bytes
+    """
+    if isinstance(size, int):
+        return size
+    
+    match = _SIZE_RE.match(str(size))
+    if not match:
+        raise ValueError(f"Invalid size value: {size!r}")
+    
+    number, unit = match.groups()
+    return int(float(number) * _SIZE_UNITS[unit.upper()])
+
+
+def _freeze(value: Any) -> Any:
+    """Return a read-only view of nested dicts and lists."""
+    if isinstance(value, dict):
+        return MappingProxyType({k: _freeze(v) for k, v in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
+def _json_default(obj: Any) -> Any:
+    """Serialize values the JSON encoders do not handle natively."""
+    if isinstance(obj, (datetime, date)):
+        return obj.isoformat()
+    if isinstance(obj, (Decimal, Path)):
+        return str(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _write_json(data: Dict[str, Any], path: Path):
+    """Write data as indented JSON."""
+    # Encode before opening the file so an unserializable value cannot truncate it
+    path.write_bytes(jsonio.dumps(data, default=_json_default, indent=True))
+
 class DeploymentConfig:
     """
     Manages deployment configuration for DreamVault agents.
@@ -76,37 +137,64 @@ class DeploymentConfig:
             }
         }
         
+        # Parsed size settings, populated by _load_config
+        self._parsed: Dict[str, int] = {}
+        
+        # Deferred saves while inside batch()
+        self._batch_depth = 0
+        self._dirty = False
+        
+        # Cached get_summary() result, cleared on mutation
+        self._summary_cache: Optional[Mapping[str, Any]] = None
+        
         # Load or create configuration
         self.config = self._load_config()
         
-        logger.info(f"✅ Deployment Config initialized: {config_file}")
+        logger.info("✅ Deployment Config initialized: %s", config_file)
     
     def _load_config(self) -> Dict[str, Any]:
         """Load configuration from file or create default."""
         try:
-            if self.config_file.exists():
-                with open(self.config_file, 'r', encoding='utf-8') as f:
-                    config = json.load(f)
-                logger.info(f"✅ Loaded configuration from {self.config_file}")
-            else:
-                config = self.default_config.copy()
+            try:
+                f = open(self.config_file, 'rb')
+            except FileNotFoundError:
+                config = copy.deepcopy(self.default_config)
                 self._save_config(config)
-                logger.info(f"✅ Created default configuration at {self.config_file}")
+                logger.info("✅ Created default configuration at %s", self.config_file)
+            else:
+                with f:
+                    config = jsonio.loads(f.read())
+                logger.info("✅ Loaded configuration from %s", self.config_file)
             
+            self._parse_sizes(config)
             return config
             
         except Exception as e:
-            logger.error(f"Error loading configuration: {e}")
-            return self.default_config.copy()
+            logger.error("Error loading configuration: %s", e)
+            config = copy.deepcopy(self.default_config)
+            self._parse_sizes(config)
+            return config
+    
+    def _parse_sizes(self, config: Dict[str, Any]):
+        """Parse size strings in the configuration to byte counts once."""
+        for parsed_key, source_key in _SIZE_KEYS.items():
+            section, name = source_key.split('.')
+            default = self.default_config[section][name]
+            section_cfg = config.get(section)
+            value = section_cfg.get(name, default) if isinstance(section_cfg, dict) else default
+            try:
+                self._parsed[parsed_key] = _parse_size(value)
+            except (ValueError, TypeError):
+                logger.warning("Invalid size for %s: %r, using %s", source_key, value, default)
+                self._parsed[parsed_key] = _parse_size(default)
     
     def _save_config(self, config: Dict[str, Any]):
         """Save configuration to file."""
         try:
-            with open(self.config_file, 'w', encoding='utf-8') as f:
-                json.dump(config, f, indent=2, default=str)
-            logger.info(f"✅ Configuration saved to {self.config_file}")
+            _write_json(config, self.config_file)
+            logger.info("✅ Configuration saved to %s", self.config_file)
         except Exception as e:
-            logger.error(f"Error saving configuration: {e}")
+            logger.error("Error saving configuration: %s", e)
     
     def get(self, key: str, default: Any = None) -> Any:
         """
@@ -148,11 +236,37 @@ class DeploymentConfig:
         
         # Set the value
         config[keys[-1]] = value
+        self._summary_cache = None
         
-        # Save configuration
-        self._save_config(self.config)
+        if key in _SIZE_KEYS.values():
+            self._parse_sizes(self.config)
+        
+        # Save configuration (deferred while batching)
+        self._dirty = True
+        if self._batch_depth == 0:
+            self._save_config(self.config)
+            self._dirty = False
         
-        logger.info(f"✅ Configuration updated: {key} = {value}")
+        logger.info("✅ Configuration updated: %s = %s", key, value)
+    
+    @contextmanager
+    def batch(self):
+        """
+        Defer configuration saves until the outermost batch exits.
+        
+        Example:
+            with config.batch():
+                config.set('api_server.port', 9000)
+                config.set('web_interface.port', 9080)
+        """
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0 and self._dirty:
+                self._save_config(self.config)
+                self._dirty = False
     
     def get_api_config(self) -> Dict[str, Any]:
         """Get API server configuration."""
@@ -178,6 +292,14 @@ class DeploymentConfig:
         """Get logging configuration."""
         return self.get('logging', {})
     
+    def get_max_request_size_bytes(self) -> int:
+        """Get maximum request size in bytes."""
+        return self._parsed['security.max_request_size_bytes']
+    
+    def get_max_log_file_size_bytes(self) -> int:
+        """Get maximum log file size in bytes."""
+        return self._parsed['logging.max_file_size_bytes']
+    
     def validate_config(self) -> bool:
         """
         Validate configuration.
@@ -190,7 +312,7 @@ class DeploymentConfig:
             required_sections = ['api_server', 'web_interface', 'model_manager']
             for section in required_sections:
                 if section not in self.config:
-                    logger.error(f"Missing required configuration section: {section}")
+                    logger.error("Missing required configuration section: %s", section)
                     return False
             
             # Validate API server config
@@ -222,12 +344,14 @@ class DeploymentConfig:
             return True
             
         except Exception as e:
-            logger.error(f"Configuration validation error: {e}")
+            logger.error("Configuration validation error: %s", e)
             return False
     
     def reset_to_defaults(self):
         """Reset configuration to defaults."""
-        self.config = self.default_config.copy()
+        self.config = copy.deepcopy(self.default_config)
+        self._summary_cache = None
+        self._parse_sizes(self.config)
         self._save_config(self.config)
         logger.info("✅ Configuration reset to defaults")
     
@@ -242,13 +366,12 @@ class DeploymentConfig:
             output_path = Path(output_file)
             output_path.parent.mkdir(parents=True, exist_ok=True)
             
-            with open(output_path, 'w', encoding='utf-8') as f:
-                json.dump(self.config, f, indent=2, default=str)
+            _write_json(self.config, output_path)
             
-            logger.info(f"✅ Configuration exported to {output_file}")
+            logger.info("✅ Configuration exported to %s", output_file)
             
         except Exception as e:
-            logger.error(f"Error exporting configuration: {e}")
+            logger.error("Error exporting configuration: %s", e)
     
     def import_config(self, input_file: str):
         """
@@ -258,13 +381,14 @@ class DeploymentConfig:
             input_file: Input file path
         """
         try:
-            input_path = Path(input_file)
-            if not input_path.exists():
-                logger.error(f"Configuration file not found: {input_file}")
+            try:
+                f = open(input_file, 'rb')
+            except FileNotFoundError:
+                logger.error("Configuration file not found: %s", input_file)
                 return False
             
-            with open(input_path, 'r', encoding='utf-8') as f:
-                config = json.load(f)
+            with f:
+                config = jsonio.loads(f.read())
             
             # Validate imported config
             if not isinstance(config, dict):
@@ -272,23 +396,30 @@ class DeploymentConfig:
                 return False
             
             self.config = config
+            self._summary_cache = None
+            self._parse_sizes(self.config)
             self._save_config(self.config)
             
-            logger.info(f"✅ Configuration imported from {input_file}")
+            logger.info("✅ Configuration imported from %s", input_file)
             return True
             
         except Exception as e:
-            logger.error(f"Error importing configuration: {e}")
+            logger.error("Error importing configuration: %s", e)
             return False
     
-    def get_summary(self) -> Dict[str, Any]:
+    def get_summary(self) -> Mapping[str, Any]:
         """
         Get configuration summary.
         
         Returns:
-            Configuration summary
+            Read-only configuration summary
         """
-        return {
+        # The cached snapshot is frozen, so it can be shared between callers
+        # without letting them alter it or the configuration behind it
+        if self._summary_cache is not None:
+            return self._summary_cache
+        
+        self._summary_cache = _freeze({
             "config_file": str(self.config_file),
             "api_server": {
                 "host": self.get('api_server.host'),
@@ -313,4 +444,6 @@ class DeploymentConfig:
                 "enable_caching": self.get('performance.enable_caching'),
                 "max_concurrent_requests": self.get('performance.max_concurrent_requests')
             }
-        } 
\ No newline at end of file
+        })
+        
+        return self._summary_cache
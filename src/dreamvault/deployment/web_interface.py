@@ -4,87 +4,91 @@ Web Interface for DreamVault Agent Deployment
 Provides a modern web UI for interacting with trained AI agents.
 """
 
-import json
+import asyncio
+import gzip
+import hashlib
 import logging
+import mimetypes
+import os
+import socket
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, Any, Optional
 import webbrowser
 import threading
 import time
 
+from ..utils import jsonio
+
 try:
-    from flask import Flask, render_template, request, jsonify, send_from_directory
+    from flask import Flask, Response, render_template, request, jsonify, send_from_directory
     from flask_cors import CORS
+    from werkzeug.security import safe_join
     FLASK_AVAILABLE = True
 except ImportError:
     FLASK_AVAILABLE = False
     Flask = None
 
+try:
+    from flask_compress import Compress
+    COMPRESS_AVAILABLE = True
+except ImportError:
+    COMPRESS_AVAILABLE = False
+    Compress = None
+
+try:
+    import uvicorn
+    from asgiref.wsgi import WsgiToAsgi
+    UVICORN_AVAILABLE = True
+except ImportError:
+    UVICORN_AVAILABLE = False
+    uvicorn = None
+
+try:
+    import waitress
+    WAITRESS_AVAILABLE = True
+except ImportError:
+    WAITRESS_AVAILABLE = False
+    waitress = None
+
+try:
+    import uvloop  # noqa: F401 - selected by name in uvicorn.Config
+    UVLOOP_AVAILABLE = sys.platform != 'win32'
+except ImportError:
+    UVLOOP_AVAILABLE = False
+
+try:
+    import httpx
+    HTTPX_AVAILABLE = True
+except ImportError:
+    HTTPX_AVAILABLE = False
+    httpx = None
+
+try:
+    import h2  # noqa: F401 - enables HTTP/2 in httpx
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+try:
+    import rcssmin
+    import rjsmin
+    MINIFY_AVAILABLE = True
+except ImportError:
+    MINIFY_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
-class AgentWebInterface:
-    """
-    Web interface for DreamVault AI agents.
-    
-    Provides a modern, responsive web UI for:
-    - Chatting with conversation agents
-    - Summarizing text
-    - Asking questions
-    - Following instructions
-    - Generating embeddings
-    - Model management
-    """
-    
-    def __init__(self, api_url: str = "http://localhost:8000", host: str = "0.0.0.0", port: int = 8080):
-        """
-        Initialize the web interface.
-        
-        Args:
-            api_url: URL of the API server
-            host: Web server host address
-            port: Web server port
-        """
-        if not FLASK_AVAILABLE:
-            raise ImportError("Flask is required for web interface. Install with: pip install flask flask-cors")
-        
-        self.api_url = api_url.rstrip('/')
-        self.host = host
-        self.port = port
-        
-        # Initialize Flask app
-        self.app = Flask(__name__)
-        CORS(self.app)
-        
-        # Register routes
-        self._register_routes()
-        
-        # Server thread
-        self.server_thread = None
-        self.running = False
-        
-        logger.info(f"✅ Web Interface initialized: http://{host}:{port}")
-    
-    def _register_routes(self):
-        """Register web routes."""
-        
-        @self.app.route('/')
-        def index():
-            """Main interface page."""
-            return self._render_main_interface()
-        
-        @self.app.route('/api/proxy/<path:endpoint>', methods=['GET', 'POST'])
-        def api_proxy(endpoint):
-            """Proxy API requests to the backend."""
-            return self._proxy_api_request(endpoint, request)
-        
-        @self.app.route('/static/<path:filename>')
-        def static_files(filename):
-            """Serve static files."""
-            return self._serve_static_file(filename)
-    
-    def _render_main_interface(self) -> str:
-        """Render the main web interface."""
-        html = """
+# Path prefix of the API proxy route
+_PROXY_PREFIX = '/api/proxy/'
+
+# Proxied GET endpoints that rarely change and may be cached briefly by the browser
+_CACHEABLE_ENDPOINTS = frozenset({'models'})
+_CACHEABLE_MAX_AGE = 'private, max-age=10'
+
+_MAIN_HTML = """
 <!DOCTYPE html>
 <html lang="en">
 <head>
@@ -316,7 +320,7 @@ class AgentWebInterface:
                     <label for="conversation-input">Message:</label>
                     <textarea id="conversation-input" placeholder="Type your message here..."></textarea>
                 </div>
-                <button class="btn" onclick="sendConversation()">Send Message</button>
+                <button class="btn" id="conversation-button" onclick="sendConversation()">Send Message</button>
                 <div class="loading" id="conversation-loading">
                     <div class="spinner"></div>
                     <p>Generating response...</p>
@@ -331,7 +335,7 @@ class AgentWebInterface:
                     <label for="summarize-text">Text to Summarize:</label>
                     <textarea id="summarize-text" placeholder="Paste text to summarize..."></textarea>
                 </div>
-                <button class="btn" onclick="summarizeText()">Summarize</button>
+                <button class="btn" id="summarize-button" onclick="summarizeText()">Summarize</button>
                 <div class="loading" id="summarize-loading">
                     <div class="spinner"></div>
                     <p>Generating summary...</p>
@@ -350,7 +354,7 @@ class AgentWebInterface:
                     <label for="qa-context">Context (optional):</label>
                     <textarea id="qa-context" placeholder="Provide context for the question..."></textarea>
                 </div>
-                <button class="btn" onclick="askQuestion()">Ask Question</button>
+                <button class="btn" id="qa-button" onclick="askQuestion()">Ask Question</button>
                 <div class="loading" id="qa-loading">
                     <div class="spinner"></div>
                     <p>Finding answer...</p>
@@ -365,7 +369,7 @@ class AgentWebInterface:
                     <label for="instruction-text">Instruction:</label>
                     <textarea id="instruction-text" placeholder="Give an instruction..."></textarea>
                 </div>
-                <button class="btn" onclick="followInstruction()">Follow Instruction</button>
+                <button class="btn" id="instruction-button" onclick="followInstruction()">Follow Instruction</button>
                 <div class="loading" id="instruction-loading">
                     <div class="spinner"></div>
                     <p>Processing instruction...</p>
@@ -397,151 +401,168 @@ class AgentWebInterface:
     <script>
         let totalRequests = 0;
         
+        // In-flight request per agent card, and last submit time for debouncing
+        const controllers = {};
+        const lastSubmit = {};
+        
+        function beginRequest(type) {
+            const now = Date.now();
+            if (now - (lastSubmit[type] || 0) < 150) return null;
+            lastSubmit[type] = now;
+            
+            // Buttons stay enabled while loading, so resubmitting cancels any
+            // request still in flight for this card
+            if (controllers[type]) controllers[type].abort();
+            const controller = new AbortController();
+            controllers[type] = controller;
+            return controller.signal;
+        }
+        
+        // Status polling: starts at 30 s, doubles up to 5 min while unchanged, pauses when hidden
+        const STATUS_MIN_DELAY = 30000;
+        const STATUS_MAX_DELAY = 300000;
+        let statusTimer = null;
+        let statusDelay = STATUS_MIN_DELAY;
+        let lastStatus = null;
+        
         // Initialize
         document.addEventListener('DOMContentLoaded', function() {
-            checkAPIStatus();
-            loadModels();
+            refreshStatus();
+            if (document.visibilityState === 'visible') scheduleStatus(STATUS_MIN_DELAY);
         });
         
-        async function checkAPIStatus() {
-            try {
-                const response = await fetch('/api/proxy/health');
-                const data = await response.json();
-                document.getElementById('api-status').textContent = 'Online';
-                document.getElementById('api-status').style.color = '#28a745';
-            } catch (error) {
-                document.getElementById('api-status').textContent = 'Offline';
-                document.getElementById('api-status').style.color = '#dc3545';
+        document.addEventListener('visibilitychange', function() {
+            if (document.visibilityState === 'visible') {
+                refreshStatus();
+                scheduleStatus(STATUS_MIN_DELAY);
+            } else {
+                clearTimeout(statusTimer);
             }
+        });
+        
+        function scheduleStatus(delay) {
+            clearTimeout(statusTimer);
+            statusDelay = delay;
+            statusTimer = setTimeout(async () => {
+                const changed = await refreshStatus();
+                scheduleStatus(changed ? STATUS_MIN_DELAY : Math.min(statusDelay * 2, STATUS_MAX_DELAY));
+            }, delay);
         }
         
-        async function loadModels() {
+        async function refreshStatus() {
+            let online = false;
+            let modelsLoaded = 0;
             try {
-                const response = await fetch('/api/proxy/models');
+                const response = await fetch('/api/status');
                 const data = await response.json();
-                document.getElementById('models-loaded').textContent = data.total_loaded || 0;
+                online = data.api === 'online';
+                modelsLoaded = data.models_loaded || 0;
             } catch (error) {
-                console.error('Error loading models:', error);
+                online = false;
             }
+            
+            document.getElementById('api-status').textContent = online ? 'Online' : 'Offline';
+            document.getElementById('api-status').style.color = online ? '#28a745' : '#dc3545';
+            document.getElementById('models-loaded').textContent = modelsLoaded;
+            
+            // Report whether the status changed so polling can back off
+            const status = online + ':' + modelsLoaded;
+            const changed = status !== lastStatus;
+            lastStatus = status;
+            return changed;
         }
         
         async function sendConversation() {
             const input = document.getElementById('conversation-input').value.trim();
             if (!input) return;
-            
-            showLoading('conversation');
-            totalRequests++;
-            document.getElementById('total-requests').textContent = totalRequests;
-            
-            try {
-                const response = await fetch('/api/proxy/conversation', {
-                    method: 'POST',
-                    headers: {'Content-Type': 'application/json'},
-                    body: JSON.stringify({input: input})
-                });
-                
-                const data = await response.json();
-                hideLoading('conversation');
-                
-                if (data.status === 'success') {
-                    document.getElementById('conversation-response').textContent = data.response;
-                } else {
-                    document.getElementById('conversation-response').textContent = 'Error: ' + data.error;
-                }
-            } catch (error) {
-                hideLoading('conversation');
-                document.getElementById('conversation-response').textContent = 'Error: ' + error.message;
-            }
+            await runAgent('conversation', {input: input});
         }
         
         async function summarizeText() {
             const text = document.getElementById('summarize-text').value.trim();
             if (!text) return;
-            
-            showLoading('summarize');
-            totalRequests++;
-            document.getElementById('total-requests').textContent = totalRequests;
-            
-            try {
-                const response = await fetch('/api/proxy/summarize', {
-                    method: 'POST',
-                    headers: {'Content-Type': 'application/json'},
-                    body: JSON.stringify({text: text})
-                });
-                
-                const data = await response.json();
-                hideLoading('summarize');
-                
-                if (data.status === 'success') {
-                    document.getElementById('summarize-response').textContent = data.response;
-                } else {
-                    document.getElementById('summarize-response').textContent = 'Error: ' + data.error;
-                }
-            } catch (error) {
-                hideLoading('summarize');
-                document.getElementById('summarize-response').textContent = 'Error: ' + error.message;
-            }
+            await runAgent('summarize', {text: text});
         }
         
         async function askQuestion() {
             const question = document.getElementById('qa-question').value.trim();
             const context = document.getElementById('qa-context').value.trim();
             if (!question) return;
+            await runAgent('qa', {
+                question: question,
+                context: context
+            });
+        }
+        
+        async function followInstruction() {
+            const instruction = document.getElementById('instruction-text').value.trim();
+            if (!instruction) return;
+            await runAgent('instruction', {instruction: instruction});
+        }
+        
+        async function runAgent(type, payload) {
+            const signal = beginRequest(type);
+            if (!signal) return;
             
-            showLoading('qa');
+            showLoading(type);
             totalRequests++;
             document.getElementById('total-requests').textContent = totalRequests;
             
             try {
-                const response = await fetch('/api/proxy/qa', {
+                // Read the server-sent event stream so output renders as it arrives
+                const response = await fetch('/api/stream/' + type, {
                     method: 'POST',
+                    signal: signal,
                     headers: {'Content-Type': 'application/json'},
-                    body: JSON.stringify({
-                        question: question,
-                        context: context
-                    })
+                    body: JSON.stringify(payload)
                 });
                 
-                const data = await response.json();
-                hideLoading('qa');
+                const reader = response.body.getReader();
+                const decoder = new TextDecoder();
+                let buffer = '';
                 
-                if (data.status === 'success') {
-                    document.getElementById('qa-response').textContent = data.response;
-                } else {
-                    document.getElementById('qa-response').textContent = 'Error: ' + data.error;
+                while (true) {
+                    const {done, value} = await reader.read();
+                    if (done) break;
+                    
+                    buffer += decoder.decode(value, {stream: true});
+                    let boundary;
+                    while ((boundary = buffer.indexOf('\\n\\n')) >= 0) {
+                        handleStreamEvent(type, buffer.slice(0, boundary));
+                        buffer = buffer.slice(boundary + 2);
+                    }
                 }
+                
+                hideLoading(type);
             } catch (error) {
-                hideLoading('qa');
-                document.getElementById('qa-response').textContent = 'Error: ' + error.message;
+                if (error.name === 'AbortError') return;
+                hideLoading(type);
+                document.getElementById(type + '-response').textContent = 'Error: ' + error.message;
             }
         }
         
-        async function followInstruction() {
-            const instruction = document.getElementById('instruction-text').value.trim();
-            if (!instruction) return;
+        function handleStreamEvent(type, frame) {
+            let event = 'message';
+            const lines = [];
+            for (const line of frame.split('\\n')) {
+                if (line.startsWith('event: ')) event = line.slice(7);
+                else if (line.startsWith('data: ')) lines.push(line.slice(6));
+            }
             
-            showLoading('instruction');
-            totalRequests++;
-            document.getElementById('total-requests').textContent = totalRequests;
+            const output = document.getElementById(type + '-response');
+            const data = lines.join('\\n');
             
-            try {
-                const response = await fetch('/api/proxy/instruction', {
-                    method: 'POST',
-                    headers: {'Content-Type': 'application/json'},
-                    body: JSON.stringify({instruction: instruction})
-                });
-                
-                const data = await response.json();
-                hideLoading('instruction');
-                
-                if (data.status === 'success') {
-                    document.getElementById('instruction-response').textContent = data.response;
+            if (event === 'token') {
+                output.textContent += data;
+            } else if (event === 'result') {
+                const result = JSON.parse(data);
+                if (result.status === 'success') {
+                    output.textContent = result.response;
                 } else {
-                    document.getElementById('instruction-response').textContent = 'Error: ' + data.error;
+                    output.textContent = 'Error: ' + result.error;
                 }
-            } catch (error) {
-                hideLoading('instruction');
-                document.getElementById('instruction-response').textContent = 'Error: ' + error.message;
+            } else if (event === 'error') {
+                output.textContent = 'Error: ' + data;
             }
         }
         
@@ -552,54 +573,579 @@ class AgentWebInterface:
         
         function hideLoading(type) {
             document.getElementById(type + '-loading').style.display = 'none';
+            delete controllers[type];
         }
-        
-        // Auto-refresh status every 30 seconds
-        setInterval(() => {
-            checkAPIStatus();
-            loadModels();
-        }, 30000);
     </script>
 </body>
 </html>
         """
+
+
+def _minify_html(html: str) -> str:
+    """Minify the page's embedded CSS and JS when rcssmin/rjsmin are installed."""
+    if not MINIFY_AVAILABLE:
         return html
     
+    head, _, rest = html.partition('<style>')
+    css, _, rest = rest.partition('</style>')
+    body, _, rest = rest.partition('<script>')
+    js, _, tail = rest.partition('</script>')
+    return f"{head}<style>{rcssmin.cssmin(css)}</style>{body}<script>{rjsmin.jsmin(js)}</script>{tail}"
+
+
+# Main page minified, encoded, compressed and tagged once at import
+_HTML = _minify_html(_MAIN_HTML).encode('utf-8')
+_HTML_GZ = gzip.compress(_HTML, 9)
+_ETAG = hashlib.blake2b(_HTML, digest_size=12).hexdigest()
+
+# Upstream responses larger than this are streamed rather than buffered
+_STREAM_THRESHOLD = 64 * 1024
+_STREAM_CHUNK_SIZE = 16384
+
+# Static asset types worth compressing
+_COMPRESSIBLE_TYPES = {'text/css', 'text/javascript', 'application/javascript', 'application/json', 'image/svg+xml'}
+
+
+def _build_status(health, models) -> Dict[str, Any]:
+    """Merge upstream /health and /models results into one status payload."""
+    online = not isinstance(health, Exception) and health.status_code == 200
+    models_loaded = 0
+    if not isinstance(models, Exception) and models.status_code == 200:
+        try:
+            models_loaded = jsonio.loads(models.content).get('total_loaded', 0)
+        except ValueError:
+            pass
+    return {"api": "online" if online else "offline", "models_loaded": models_loaded}
+
+
+def _body_etag(body: bytes) -> str:
+    """Compute an unquoted strong ETag for a response body."""
+    return hashlib.blake2b(body, digest_size=12).hexdigest()
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    """Check an If-None-Match header value against an unquoted ETag."""
+    for candidate in if_none_match.split(','):
+        candidate = candidate.strip()
+        if candidate.startswith('W/'):
+            candidate = candidate[2:]
+        if candidate == '*' or candidate.strip('"') == etag:
+            return True
+    return False
+
+
+def _sse_event(event: str, data: str) -> str:
+    """Format a server-sent event, prefixing every data line."""
+    lines = ''.join(f"data: {line}\n" for line in data.split('\n'))
+    return f"event: {event}\n{lines}\n"
+
+
+def _build_upstream_request(client, method: str, endpoint: str, body: bytes, content_type: Optional[str]):
+    """
+    Build the backend request for a proxied call.
+    
+    Shared by the WSGI and ASGI proxy paths so both forward the same thing:
+    POST bodies are passed through raw with the client's Content-Type
+    (JSON when the client sent none).
+    
+    Args:
+        client: httpx.Client or httpx.AsyncClient bound to the API server
+        method: "GET" or "POST"
+        endpoint: Backend path without the leading slash
+        body: Raw request body
+        content_type: Content-Type header sent by the client, if any
+    """
+    if method == 'POST':
+        return client.build_request(
+            'POST',
+            f"/{endpoint}",
+            content=body,
+            headers={'Content-Type': content_type or 'application/json'}
+        )
+    return client.build_request(method, f"/{endpoint}")
+
+
+def _should_stream(headers) -> bool:
+    """Check whether an upstream response should be streamed to the client."""
+    if headers.get('transfer-encoding', '').lower() == 'chunked':
+        return True
+    try:
+        return int(headers.get('content-length', 0)) > _STREAM_THRESHOLD
+    except ValueError:
+        return False
+
+
+def _iter_upstream(response, raw: bool = False):
+    """Yield an upstream response body in chunks, closing it when done.
+    
+    With raw set, the body is passed on still content-encoded.
+    """
+    try:
+        if raw:
+            yield from response.iter_raw(chunk_size=_STREAM_CHUNK_SIZE)
+        else:
+            yield from response.iter_bytes(chunk_size=_STREAM_CHUNK_SIZE)
+    finally:
+        response.close()
+
+
+@lru_cache(maxsize=64)
+def _gzip_static(path: str, mtime_ns: int, size: int) -> tuple:
+    """
+    Compress a static file once per (path, mtime, size) version.
+    
+    Returns:
+        Tuple of (gzipped bytes, ETag value)
+    """
+    with open(path, 'rb') as f:
+        data = f.read()
+    etag = hashlib.blake2b(data, digest_size=12).hexdigest()
+    return gzip.compress(data, 9), etag
+
+class AgentWebInterface:
+    """
+    Web interface for DreamVault AI agents.
+    
+    Provides a modern, responsive web UI for:
+    - Chatting with conversation agents
+    - Summarizing text
+    - Asking questions
+    - Following instructions
+    - Generating embeddings
+    - Model management
+    """
+    
+    def __init__(self, api_url: str = "http://localhost:8000", host: str = "0.0.0.0", port: int = 8080,
+                 socket_path: Optional[str] = None):
+        """
+        Initialize the web interface.
+        
+        Args:
+            api_url: URL of the API server
+            host: Web server host address
+            port: Web server port
+            socket_path: Unix domain socket to listen on instead of host/port,
+                for use behind a reverse proxy such as nginx
+        """
+        if not FLASK_AVAILABLE:
+            raise ImportError("Flask is required for web interface. Install with: pip install flask flask-cors")
+        if not HTTPX_AVAILABLE:
+            raise ImportError("httpx is required for web interface. Install with: pip install httpx")
+        
+        self.api_url = api_url.rstrip('/')
+        self.host = host
+        self.port = port
+        self.socket_path = socket_path
+        self._static_dir = Path(__file__).parent / 'static'
+        
+        # Pooled keep-alive HTTP client for proxying to the API server;
+        # closed by stop() and reopened by start()
+        self._http = None
+        self._status_pool = None
+        self._open_clients()
+        
+        # Initialize Flask app (static files are served by _serve_static_file)
+        self.app = Flask(__name__, static_folder=None)
+        CORS(self.app)
+        
+        # Compress text responses. Responses that already carry Content-Encoding
+        # (pre-gzipped pages, encoded upstream bodies) are skipped, and streamed
+        # ones (large proxied bodies, server-sent events) are left unbuffered.
+        if COMPRESS_AVAILABLE:
+            self.app.config.update(
+                COMPRESS_MIMETYPES=['text/html', 'text/css', 'application/javascript', 'application/json'],
+                COMPRESS_LEVEL=6,
+                COMPRESS_MIN_SIZE=500,
+                COMPRESS_ALGORITHM=['br', 'gzip'],
+                COMPRESS_STREAMS=False
+            )
+            Compress(self.app)
+        
+        # Register routes
+        self._register_routes()
+        
+        # Async proxy client, created on ASGI lifespan startup
+        self._aclient = None
+        
+        # Server thread
+        self.server_thread = None
+        self._server = None
+        self._wsgi_server = None
+        self.running = False
+        
+        logger.info(f"✅ Web Interface initialized: {self._display_url()}")
+    
+    def _register_routes(self):
+        """Register web routes."""
+        
+        @self.app.route('/')
+        def index():
+            """Main interface page."""
+            return self._serve_main_interface(request)
+        
+        @self.app.route('/api/proxy/<path:endpoint>', methods=['GET', 'POST'])
+        def api_proxy(endpoint):
+            """Proxy API requests to the backend."""
+            return self._proxy_api_request(endpoint, request)
+        
+        @self.app.route('/api/stream/<name>', methods=['POST'])
+        def api_stream(name):
+            """Stream an agent response to the browser as server-sent events."""
+            return self._stream_agent_request(name, request)
+        
+        @self.app.route('/api/status')
+        def api_status():
+            """Aggregated API health and model status."""
+            return self._serve_status(request)
+        
+        @self.app.route('/static/<path:filename>')
+        def static_files(filename):
+            """Serve static files."""
+            return self._serve_static_file(filename, request)
+    
+    def _serve_main_interface(self, request):
+        """Serve the precomputed main page, honoring ETag and gzip negotiation."""
+        headers = {
+            'ETag': f'"{_ETAG}"',
+            'Cache-Control': 'public, max-age=3600',
+            'Vary': 'Accept-Encoding'
+        }
+        
+        if request.if_none_match.contains(_ETAG):
+            return Response(status=304, headers=headers)
+        
+        if 'gzip' in request.accept_encodings:
+            headers['Content-Encoding'] = 'gzip'
+            return Response(_HTML_GZ, mimetype='text/html', headers=headers)
+        
+        return Response(_HTML, mimetype='text/html', headers=headers)
+    
+    def _open_clients(self):
+        """Create the proxy HTTP client and status thread pool if they are closed."""
+        if self._http is None:
+            self._http = self._create_http_client()
+        if self._status_pool is None:
+            self._status_pool = ThreadPoolExecutor(max_workers=2)
+    
+    def _create_http_client(self) -> "httpx.Client":
+        """
+        Create a pooled HTTP client so proxied calls reuse connections.
+        
+        With h2 installed, concurrent proxied calls share one multiplexed
+        HTTP/2 connection to the API server.
+        """
+        transport = httpx.HTTPTransport(
+            http2=HTTP2_AVAILABLE,
+            limits=httpx.Limits(max_keepalive_connections=32, max_connections=128),
+            retries=3
+        )
+        return httpx.Client(base_url=self.api_url, transport=transport, timeout=30.0)
+    
     def _proxy_api_request(self, endpoint: str, request):
         """Proxy API requests to the backend."""
         try:
-            import requests
+            if request.method not in ('GET', 'POST'):
+                return jsonify({"error": "Method not allowed"}), 405
             
-            url = f"{self.api_url}/{endpoint}"
+            # Forward the raw body instead of decoding and re-encoding the JSON
+            upstream = _build_upstream_request(
+                self._http, request.method, endpoint,
+                request.get_data(cache=True), request.headers.get('Content-Type')
+            )
+            response = self._http.send(upstream, stream=True)
             
-            if request.method == 'GET':
-                response = requests.get(url)
-            elif request.method == 'POST':
-                response = requests.post(url, json=request.json)
-            else:
-                return jsonify({"error": "Method not allowed"}), 405
+            # Hand an already-compressed body to the client as-is when it
+            # accepts that encoding, rather than decoding and recompressing it
+            encoding = response.headers.get('content-encoding')
+            passthrough = bool(encoding) and encoding in request.accept_encodings
+            encoding_headers = {'Content-Encoding': encoding} if passthrough else {}
+            
+            # Stream large or chunked bodies instead of buffering them in memory
+            if _should_stream(response.headers):
+                return Response(
+                    _iter_upstream(response, raw=passthrough),
+                    status=response.status_code,
+                    content_type=response.headers.get('content-type', 'application/json'),
+                    headers=encoding_headers
+                )
             
-            return response.json(), response.status_code
+            try:
+                body = b''.join(response.iter_raw()) if passthrough else response.read()
+            finally:
+                response.close()
+            
+            # Let repeated polls of slow-changing endpoints revalidate with a
+            # 304 instead of resending the body
+            headers = dict(encoding_headers)
+            if (request.method == 'GET' and response.status_code == 200
+                    and endpoint.strip('/') in _CACHEABLE_ENDPOINTS):
+                etag = _body_etag(body)
+                headers.update({'ETag': f'"{etag}"', 'Cache-Control': _CACHEABLE_MAX_AGE})
+                if request.if_none_match.contains(etag):
+                    return Response(status=304, headers=headers)
+            
+            # Pass the upstream JSON through as-is rather than decoding and re-encoding it
+            return Response(
+                body,
+                status=response.status_code,
+                content_type=response.headers.get('content-type', 'application/json'),
+                headers=headers
+            )
             
         except Exception as e:
             logger.error(f"API proxy error: {e}")
             return jsonify({"error": str(e)}), 500
     
-    def _serve_static_file(self, filename: str):
-        """Serve static files."""
-        # For now, return 404 since we're embedding everything in HTML
-        return "File not found", 404
+    def _stream_agent_request(self, name: str, request):
+        """
+        Relay an agent call as server-sent events.
+        
+        Text responses are forwarded as "token" events while they arrive; JSON
+        responses are sent whole as a single "result" event.
+        """
+        body = request.get_data(cache=True)
+        content_type = request.headers.get('Content-Type')
+        
+        def events():
+            try:
+                upstream = _build_upstream_request(self._http, 'POST', name, body, content_type)
+                response = self._http.send(upstream, stream=True)
+            except Exception as e:
+                logger.error(f"API stream error: {e}")
+                yield _sse_event('error', str(e))
+                return
+            
+            try:
+                if response.headers.get('content-type', '').startswith('application/json'):
+                    yield _sse_event('result', response.read().decode('utf-8'))
+                else:
+                    for chunk in response.iter_text():
+                        yield _sse_event('token', chunk)
+                yield _sse_event('done', '')
+            finally:
+                response.close()
+        
+        return Response(
+            events(),
+            mimetype='text/event-stream',
+            headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'}
+        )
+    
+    def _serve_status(self, request):
+        """Serve the aggregated status, letting the poller revalidate with a 304."""
+        body = jsonio.dumps(self._get_status())
+        etag = _body_etag(body)
+        headers = {'ETag': f'"{etag}"', 'Cache-Control': 'no-cache'}
+        if request.if_none_match.contains(etag):
+            return Response(status=304, headers=headers)
+        return Response(body, mimetype='application/json', headers=headers)
     
-    def start(self, open_browser: bool = True):
+    def _get_status(self) -> Dict[str, Any]:
+        """Fetch upstream /health and /models concurrently and merge them."""
+        def fetch(path):
+            try:
+                return self._http.get(path)
+            except Exception as e:
+                return e
+        
+        health, models = self._status_pool.map(fetch, ['/health', '/models'])
+        return _build_status(health, models)
+    
+    async def _async_get_status(self) -> Dict[str, Any]:
+        """Async variant of _get_status for the ASGI path."""
+        health, models = await asyncio.gather(
+            self._aclient.get('/health'),
+            self._aclient.get('/models'),
+            return_exceptions=True
+        )
+        return _build_status(health, models)
+    
+    def _create_asgi_app(self):
+        """
+        Create the ASGI application served by Uvicorn.
+        
+        Proxy requests are handled natively on the event loop with a shared
+        httpx.AsyncClient; everything else is passed to the wrapped Flask app.
+        """
+        wsgi_app = WsgiToAsgi(self.app)
+        
+        async def app(scope, receive, send):
+            if scope['type'] == 'lifespan':
+                await self._handle_lifespan(receive, send)
+            elif scope['type'] == 'http' and scope['path'].startswith(_PROXY_PREFIX):
+                await self._async_proxy_request(scope, receive, send)
+            elif scope['type'] == 'http' and scope['path'] == '/api/status':
+                await self._async_serve_status(scope, send)
+            else:
+                await wsgi_app(scope, receive, send)
+        
+        return app
+    
+    async def _async_serve_status(self, scope, send):
+        """Async variant of _serve_status for the ASGI path."""
+        body = jsonio.dumps(await self._async_get_status())
+        etag = _body_etag(body)
+        headers = [(b'etag', f'"{etag}"'.encode('latin-1')), (b'cache-control', b'no-cache')]
+        if _etag_matches(dict(scope['headers']).get(b'if-none-match', b'').decode('latin-1'), etag):
+            await self._send_not_modified(send, headers)
+            return
+        await self._send_asgi_response(send, 200, body, headers=headers)
+    
+    async def _handle_lifespan(self, receive, send):
+        """Open and close the async proxy client with the server."""
+        while True:
+            message = await receive()
+            if message['type'] == 'lifespan.startup':
+                # One pooled client for the server's lifetime; all proxy targets share a host
+                self._aclient = httpx.AsyncClient(
+                    base_url=self.api_url,
+                    limits=httpx.Limits(
+                        max_connections=100,
+                        max_keepalive_connections=32,
+                        keepalive_expiry=60.0
+                    ),
+                    timeout=30.0,
+                    http2=HTTP2_AVAILABLE
+                )
+                await send({'type': 'lifespan.startup.complete'})
+            elif message['type'] == 'lifespan.shutdown':
+                if self._aclient is not None:
+                    await self._aclient.aclose()
+                    self._aclient = None
+                await send({'type': 'lifespan.shutdown.complete'})
+                return
+    
+    async def _async_proxy_request(self, scope, receive, send):
+        """Proxy an API request to the backend without blocking a worker thread."""
+        method = scope['method']
+        if method not in ('GET', 'POST'):
+            await self._send_asgi_response(send, 405, b'{"error": "Method not allowed"}')
+            return
+        
+        # Read the request body
+        body = b''
+        more_body = True
+        while more_body:
+            message = await receive()
+            body += message.get('body', b'')
+            more_body = message.get('more_body', False)
+        
+        endpoint = scope['path'][len(_PROXY_PREFIX):]
+        request_headers = dict(scope['headers'])
+        content_type = request_headers.get(b'content-type')
+        started = False
+        try:
+            upstream = _build_upstream_request(
+                self._aclient, method, endpoint, body,
+                content_type.decode('latin-1') if content_type else None
+            )
+            response = await self._aclient.send(upstream, stream=True)
+            
+            try:
+                content_type = response.headers.get('content-type', 'application/json')
+                
+                if not _should_stream(response.headers):
+                    body = await response.aread()
+                    
+                    # Let repeated polls of slow-changing endpoints revalidate
+                    # with a 304 instead of resending the body
+                    headers = []
+                    if (method == 'GET' and response.status_code == 200
+                            and endpoint.strip('/') in _CACHEABLE_ENDPOINTS):
+                        etag = _body_etag(body)
+                        headers = [
+                            (b'etag', f'"{etag}"'.encode('latin-1')),
+                            (b'cache-control', _CACHEABLE_MAX_AGE.encode('latin-1'))
+                        ]
+                        if _etag_matches(request_headers.get(b'if-none-match', b'').decode('latin-1'), etag):
+                            await self._send_not_modified(send, headers)
+                            return
+                    
+                    await self._send_asgi_response(send, response.status_code, body, content_type, headers)
+                    return
+                
+                # Stream large or chunked bodies instead of buffering them in memory
+                await send({
+                    'type': 'http.response.start',
+                    'status': response.status_code,
+                    'headers': [(b'content-type', content_type.encode('latin-1'))]
+                })
+                started = True
+                async for chunk in response.aiter_bytes(chunk_size=_STREAM_CHUNK_SIZE):
+                    await send({'type': 'http.response.body', 'body': chunk, 'more_body': True})
+                await send({'type': 'http.response.body', 'body': b''})
+            finally:
+                await response.aclose()
+            
+        except Exception as e:
+            logger.error(f"API proxy error: {e}")
+            if not started:
+                await self._send_asgi_response(send, 500, jsonio.dumps({"error": str(e)}))
+    
+    async def _send_asgi_response(self, send, status: int, body: bytes, content_type: str = 'application/json',
+                                  headers: Optional[list] = None):
+        """Send a complete ASGI HTTP response."""
+        await send({
+            'type': 'http.response.start',
+            'status': status,
+            'headers': [
+                (b'content-type', content_type.encode('latin-1')),
+                (b'content-length', str(len(body)).encode('latin-1'))
+            ] + (headers or [])
+        })
+        await send({'type': 'http.response.body', 'body': body})
+    
+    async def _send_not_modified(self, send, headers: list):
+        """Send an empty ASGI 304 response."""
+        await send({'type': 'http.response.start', 'status': 304, 'headers': headers})
+        await send({'type': 'http.response.body', 'body': b''})
+    
+    def _serve_static_file(self, filename: str, request):
+        """
+        Serve static files.
+        
+        Compressible assets are served from a cache of pre-gzipped payloads;
+        everything else goes through send_from_directory, which uses sendfile
+        and supports Range and conditional requests.
+        """
+        path = safe_join(str(self._static_dir), filename)
+        mimetype = mimetypes.guess_type(filename)[0]
+        
+        if path and mimetype in _COMPRESSIBLE_TYPES and 'gzip' in request.accept_encodings:
+            try:
+                stat = os.stat(path)
+            except OSError:
+                return "File not found", 404
+            
+            payload, etag = _gzip_static(path, stat.st_mtime_ns, stat.st_size)
+            headers = {
+                'ETag': f'"{etag}"',
+                'Cache-Control': 'public, max-age=86400',
+                'Vary': 'Accept-Encoding'
+            }
+            if request.if_none_match.contains(etag):
+                return Response(status=304, headers=headers)
+            
+            headers['Content-Encoding'] = 'gzip'
+            return Response(payload, mimetype=mimetype, headers=headers)
+        
+        return send_from_directory(self._static_dir, filename, conditional=True, max_age=86400)
+    
+    def start(self, open_browser: bool = True) -> bool:
         """
         Start the web interface.
         
         Args:
             open_browser: Automatically open browser
+            
+        Returns:
+            True if the server is accepting connections, False if it failed to start
         """
         if self.running:
             logger.warning("Web interface already running")
-            return
+            return True
+        
+        self._open_clients()
         
         # Start server in thread
         self.running = True
@@ -609,32 +1155,132 @@ class AgentWebInterface:
         )
         self.server_thread.start()
         
-        # Wait a moment for server to start
-        time.sleep(2)
+        # Wait for the server to accept connections
+        if not self._wait_until_ready():
+            logger.error(f"❌ Web Interface did not start listening on {self._display_url()}")
+            self.stop()
+            return False
         
-        # Open browser
-        if open_browser:
+        # Open browser (not possible for a Unix socket; the reverse proxy owns the URL)
+        if open_browser and not self.socket_path:
             url = f"http://{self.host}:{self.port}"
             webbrowser.open(url)
         
-        logger.info(f"✅ Web Interface started: http://{self.host}:{self.port}")
+        logger.info(f"✅ Web Interface started: {self._display_url()}")
+        return True
+    
+    def _display_url(self) -> str:
+        """Describe where the server listens, for log messages."""
+        if self.socket_path:
+            return f"unix:{self.socket_path}"
+        return f"http://{self.host}:{self.port}"
+    
+    def _wait_until_ready(self, timeout: float = 10.0) -> bool:
+        """
+        Wait until the server accepts connections.
+        
+        Args:
+            timeout: Maximum seconds to wait
+            
+        Returns:
+            True if the server became reachable, False if it exited or timed out
+        """
+        if self.socket_path:
+            family, address = socket.AF_UNIX, self.socket_path
+        else:
+            probe_host = '127.0.0.1' if self.host == '0.0.0.0' else self.host
+            family, address = socket.AF_INET, (probe_host, self.port)
+        deadline = time.monotonic() + timeout
+        
+        while time.monotonic() < deadline:
+            with socket.socket(family, socket.SOCK_STREAM) as sock:
+                sock.settimeout(0.1)
+                if sock.connect_ex(address) == 0:
+                    return True
+            # A server that failed to bind has already exited; stop waiting
+            if self.server_thread is not None and not self.server_thread.is_alive():
+                return False
+            time.sleep(0.02)
+        
+        return False
     
     def _run_server(self):
-        """Run the Flask server."""
+        """
+        Run the web server.
+        
+        Uses Uvicorn when installed, then waitress, and falls back to Flask's
+        development server (also selected explicitly with DEBUG=1).
+        """
         try:
-            self.app.run(
-                host=self.host,
-                port=self.port,
-                debug=False,
-                use_reloader=False
-            )
+            if os.environ.get('DEBUG') == '1' or not (UVICORN_AVAILABLE or WAITRESS_AVAILABLE):
+                self._run_dev_server()
+            elif UVICORN_AVAILABLE:
+                self._run_uvicorn_server()
+            else:
+                self._run_waitress_server()
         except Exception as e:
             logger.error(f"Web interface error: {e}")
             self.running = False
     
+    def _run_uvicorn_server(self):
+        """Run the ASGI app under Uvicorn."""
+        # "auto" selects httptools when installed (uvicorn[standard])
+        config = uvicorn.Config(
+            self._create_asgi_app(),
+            host=self.host,
+            port=self.port,
+            uds=self.socket_path,
+            loop="uvloop" if UVLOOP_AVAILABLE else "asyncio",
+            http="auto",
+            log_level="warning",
+            access_log=False
+        )
+        logger.info(f"Serving with Uvicorn ({'uvloop' if UVLOOP_AVAILABLE else 'asyncio'} event loop)")
+        self._server = uvicorn.Server(config)
+        self._server.run()
+    
+    def _run_waitress_server(self):
+        """Run the Flask app under waitress's threaded WSGI server."""
+        if self.socket_path:
+            listen = {'unix_socket': self.socket_path}
+        else:
+            listen = {'host': self.host, 'port': self.port}
+        
+        logger.info("Serving with waitress")
+        self._wsgi_server = waitress.create_server(
+            self.app,
+            threads=16,
+            connection_limit=1000,
+            channel_timeout=120,
+            ident='DreamVault',
+            **listen
+        )
+        self._wsgi_server.run()
+    
+    def _run_dev_server(self):
+        """Run Flask's development server."""
+        # Werkzeug binds a Unix socket when given a unix:// host
+        self.app.run(
+            host=f"unix://{self.socket_path}" if self.socket_path else self.host,
+            port=self.port,
+            debug=False,
+            use_reloader=False
+        )
+    
     def stop(self):
         """Stop the web interface."""
         self.running = False
+        if self._server is not None:
+            # Uvicorn closes the async proxy client on lifespan shutdown
+            self._server.should_exit = True
+        if self._wsgi_server is not None:
+            self._wsgi_server.close()
+        if self._http is not None:
+            self._http.close()
+            self._http = None
+        if self._status_pool is not None:
+            self._status_pool.shutdown(wait=False)
+            self._status_pool = None
         logger.info("✅ Web Interface stopped")
     
     def is_running(self) -> bool:
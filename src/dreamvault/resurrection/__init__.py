@@ -4,6 +4,6 @@ DreamVault Resurrection Engine
 This module contains tools for resurrecting abandoned ideas and intellectual property.
 """
 
-from .ip_extractor import IPExtractor
+from .ip_extractor import IPExtractor, json_default
 
-__all__ = ["IPExtractor"] 
\ No newline at end of file
+__all__ = ["IPExtractor", "json_default"] 
\ No newline at end of file
@@ -5,14 +5,375 @@ This module extracts abandoned ideas, inventions, and proprietary workflows
 from conversation logs to create a "Lost Inventions" codex.
 """
 
-import json
+import os
 import re
 import logging
+import mmap
+import threading
+import time
+from bisect import bisect_left
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass
+from functools import lru_cache
+from itertools import repeat
 from pathlib import Path
-from typing import Dict, List, Any, Optional
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
 from datetime import datetime
 import hashlib
 
+from ..utils import jsonio
+
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+    ahocorasick = None
+
+try:
+    import re2
+    RE2_AVAILABLE = True
+except ImportError:
+    RE2_AVAILABLE = False
+    re2 = None
+
+try:
+    import hyperscan
+    HYPERSCAN_AVAILABLE = True
+except ImportError:
+    HYPERSCAN_AVAILABLE = False
+    hyperscan = None
+
+
+# IP detection patterns, without the captured tail every one of them ends
+# with (see _TAIL_TEMPLATE)
+RAW_PATTERNS = {
+    "product_ideas": [
+        r"build\s+(?:a|an)\s+",
+        r"create\s+(?:a|an)\s+",
+        r"develop\s+(?:a|an)\s+",
+        r"invent\s+(?:a|an)\s+",
+        r"design\s+(?:a|an)\s+",
+        r"app\s+(?:that|which)\s+",
+        r"platform\s+(?:that|which)\s+",
+        r"system\s+(?:that|which)\s+",
+        r"tool\s+(?:that|which)\s+",
+        r"service\s+(?:that|which)\s+"
+    ],
+    "workflows": [
+        r"workflow\s+(?:for|to)\s+",
+        r"process\s+(?:for|to)\s+",
+        r"method\s+(?:for|to)\s+",
+        r"approach\s+(?:for|to)\s+",
+        r"strategy\s+(?:for|to)\s+"
+    ],
+    "brands_names": [
+        r"brand\s+(?:name|called)\s+",
+        r"company\s+(?:name|called)\s+",
+        r"product\s+(?:name|called)\s+",
+        r"service\s+(?:name|called)\s+"
+    ],
+    "schemas": [
+        r"schema\s+(?:for|of)\s+",
+        r"structure\s+(?:for|of)\s+",
+        r"framework\s+(?:for|of)\s+",
+        r"architecture\s+(?:for|of)\s+"
+    ],
+    "abandoned_ideas": [
+        r"abandoned\s+",
+        r"gave\s+up\s+on\s+",
+        r"stopped\s+working\s+on\s+",
+        r"never\s+finished\s+",
+        r"left\s+behind\s+",
+        r"forgot\s+about\s+"
+    ]
+}
+
+# The captured text runs to the end of the sentence, bounded so a long
+# run-on text cannot make every match scan the whole remainder. Captures
+# must be longer than 10 characters, which the lower bound enforces early.
+_TAIL_TEMPLATE = r"([^.!?]{{10,{max_len}}})"
+DEFAULT_MAX_TAIL_LEN = 200
+
+
+def _leading_literal(pattern: str) -> str:
+    """Return the lowercase word every match of ``pattern`` starts with."""
+    return re.match(r"[a-z]+", pattern).group()
+
+
+def _full_patterns(max_tail_len: int) -> Dict[str, List[str]]:
+    """Return the IP detection patterns with their captured tail appended."""
+    tail = _TAIL_TEMPLATE.format(max_len=max_tail_len)
+    return {ip_type: [prefix + tail for prefix in prefixes] for ip_type, prefixes in RAW_PATTERNS.items()}
+
+
+@lru_cache(maxsize=None)
+def _pattern_table(engine: str, max_tail_len: int = DEFAULT_MAX_TAIL_LEN,
+                   ignore_case: bool = False) -> Tuple[Tuple[str, str, str, Any], ...]:
+    """Compile every pattern of every IP type with the given regex engine.
+    
+    Patterns are meant to run on lowercased text and are case-sensitive
+    unless ignore_case is set: case folding on every match attempt also
+    keeps re from using its literal prefix search. Tables are cached, so
+    each variant compiles once per process and is shared by all
+    IPExtractor instances.
+    
+    Args:
+        engine: "re" or "re2"
+        max_tail_len: Maximum length of the captured text
+        ignore_case: Compile case-insensitive patterns for text that could not be lowercased
+        
+    Returns:
+        (ip_type, source, keyword, compiled) rows; a row's position is its pattern id
+    """
+    if engine == "re2":
+        prefix = "(?i)" if ignore_case else ""
+        compile_pattern = lambda pattern: re2.compile(prefix + pattern)
+    else:
+        flags = re.IGNORECASE if ignore_case else 0
+        compile_pattern = lambda pattern: re.compile(pattern, flags)
+    
+    return tuple(
+        (ip_type, pattern, _leading_literal(pattern), compile_pattern(pattern))
+        for ip_type, patterns in _full_patterns(max_tail_len).items()
+        for pattern in patterns
+    )
+
+
+# Compiled at import time with the standard library engine
+PATTERN_TABLE = _pattern_table("re")
+
+
+def _build_keyword_automaton() -> Optional[Any]:
+    """Build an Aho-Corasick automaton over the leading keywords.
+    
+    Each keyword maps to its length and the ids of the patterns that
+    start with it.
+    
+    Returns:
+        The automaton, or None if pyahocorasick is not installed
+    """
+    if not AHOCORASICK_AVAILABLE:
+        return None
+    
+    targets: Dict[str, List[int]] = {}
+    for pattern_id, (_, _, keyword, _) in enumerate(PATTERN_TABLE):
+        targets.setdefault(keyword, []).append(pattern_id)
+    
+    automaton = ahocorasick.Automaton()
+    for keyword, pattern_ids in targets.items():
+        automaton.add_word(keyword, (len(keyword), tuple(pattern_ids)))
+    automaton.make_automaton()
+    return automaton
+
+
+KEYWORD_AUTOMATON = _build_keyword_automaton()
+
+
+def _build_hyperscan_database() -> Optional[Any]:
+    """Compile the prefix of every pattern into one Hyperscan database.
+    
+    Hyperscan has no capture groups, so only the raw patterns without the
+    captured tail are compiled. Hits are confirmed with the full pattern,
+    and the expression ids are pattern ids.
+    
+    Returns:
+        The block-mode database, or None if hyperscan is not installed
+    """
+    if not HYPERSCAN_AVAILABLE:
+        return None
+    
+    expressions = [prefix.encode() for prefixes in RAW_PATTERNS.values() for prefix in prefixes]
+    database = hyperscan.Database(mode=hyperscan.HS_MODE_BLOCK)
+    database.compile(
+        expressions=expressions,
+        ids=list(range(len(expressions))),
+        elements=len(expressions),
+        flags=[hyperscan.HS_FLAG_CASELESS | hyperscan.HS_FLAG_SOM_LEFTMOST] * len(expressions)
+    )
+    return database
+
+
+HYPERSCAN_DATABASE = _build_hyperscan_database()
+
+
+def _build_hit_matcher(patterns: Tuple[Tuple[str, str, str, Any], ...]) -> Callable[..., List[List[Tuple[int, int]]]]:
+    """Specialize the prefilter hit matcher for one pattern table.
+    
+    The bound match() method of every pattern is resolved once here, so the
+    inner loop of the returned function only touches local variables.
+    
+    Args:
+        patterns: Pattern table rows as returned by _pattern_table
+        
+    Returns:
+        match_at_hits(text, hits) -> capture spans, one list per pattern id
+    """
+    matchers = tuple(compiled.match for _, _, _, compiled in patterns)
+    pattern_count = len(matchers)
+    
+    def match_at_hits(text: str, hits: Iterable[Tuple[int, Tuple[int, ...]]]) -> List[List[Tuple[int, int]]]:
+        """Find matches by anchoring patterns at prefilter hits.
+        
+        Only the patterns a hit names are tried, with match() at its start.
+        Matches of one pattern never overlap, which gives the same result
+        as ``findall``.
+        
+        Args:
+            text: The conversation text, lowercased unless the patterns ignore case
+            hits: (start, pattern_ids) pairs, ascending start per pattern
+            
+        Returns:
+            Capture spans, one list per pattern id
+        """
+        found = [[] for _ in range(pattern_count)]
+        resume_at = [0] * pattern_count
+        
+        for start, pattern_ids in hits:
+            for pattern_id in pattern_ids:
+                if start < resume_at[pattern_id]:
+                    continue
+                m = matchers[pattern_id](text, start)
+                if m:
+                    resume_at[pattern_id] = m.end()
+                    found[pattern_id].append(m.span(1))
+        
+        return found
+    
+    return match_at_hits
+
+IP_CATEGORIES = tuple(RAW_PATTERNS)
+
+# Where the text of a conversation comes from after its messages, in the
+# order it is joined: (conversation key, field of each item holding the
+# text, whether plain string items count too). A None field means the
+# value itself is the text.
+TEXT_SOURCES = (
+    ("summary", None, False),
+    ("topics", "topic", True),
+    ("entities", "name", False),
+    ("action_items", "action", False),
+    ("decisions", "decision", False)
+)
+
+# Potential value of one extracted item of each IP type
+IP_VALUES = {
+    "product_ideas": 10000,    # Product ideas are high value
+    "workflows": 5000,         # Workflows are medium value
+    "brands_names": 3000,      # Brand names are medium value
+    "schemas": 8000,           # Schemas are high value
+    "abandoned_ideas": 15000   # Abandoned ideas are highest value (lost opportunity)
+}
+
+# Tags added for each IP type found, in tag order; bit i of a tag mask is
+# set when the i-th type has matches
+_CATEGORY_TAGS = (
+    ("product_ideas", ("product-ideas",)),
+    ("workflows", ("workflows",)),
+    ("brands_names", ("brand-names",)),
+    ("schemas", ("schemas",)),
+    ("abandoned_ideas", ("abandoned", "high-value"))
+)
+
+# Value tags above 5000, 20000 and 50000; the bin index fills the high bits
+_VALUE_THRESHOLDS = (5000, 20000, 50000)
+_VALUE_TAGS = ("low-value", "moderate", "valuable", "premium")
+
+
+def _build_tag_table() -> Tuple[Tuple[str, ...], ...]:
+    """Precompute the tag tuple for every category/value-bin mask."""
+    table = []
+    for value_bin, value_tag in enumerate(_VALUE_TAGS):
+        for flags in range(1 << len(_CATEGORY_TAGS)):
+            tags = [
+                tag
+                for bit, (_, category_tags) in enumerate(_CATEGORY_TAGS)
+                if flags & (1 << bit)
+                for tag in category_tags
+            ]
+            tags.append(value_tag)
+            table.append(tuple(tags))
+    return tuple(table)
+
+_TAG_TABLE = _build_tag_table()
+
+# Confidence steps up above 5, 10 and 20 words; counting stops past the last step
+_CONFIDENCE_WORD_STEPS = (5, 10, 20)
+_CONFIDENCE_MAX_SPLIT = _CONFIDENCE_WORD_STEPS[-1]
+_CONFIDENCE_LEVELS = (0.3, 0.5, 0.7, 0.9)
+
+
+@dataclass
+class IPMatch:
+    """A single piece of extracted IP.
+    
+    Slotted so that bulk runs with millions of matches do not pay for a
+    dict per match. ``pattern_id`` indexes the pattern legend named by the
+    ``pattern_version`` of the extraction result (see
+    IPExtractor.get_pattern_legend). Item access keeps code written against
+    the old dict records working.
+    """
+    __slots__ = ("text", "pattern_id", "confidence")
+    
+    text: str
+    pattern_id: int
+    confidence: float
+    
+    def __getitem__(self, key: str) -> Any:
+        try:
+            return getattr(self, key)
+        except AttributeError:
+            raise KeyError(key) from None
+    
+    def get(self, key: str, default: Any = None) -> Any:
+        """Return a field by name, or default if there is no such field."""
+        return getattr(self, key, default)
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert the match to a plain dictionary for serialization."""
+        return {"text": self.text, "pattern_id": self.pattern_id, "confidence": self.confidence}
+
+
+def json_default(obj: Any) -> Any:
+    """Serialize IPMatch records for json.dumps (orjson handles dataclasses).
+    
+    Pass as ``default=`` when encoding extraction results with the stdlib
+    json module.
+    """
+    if isinstance(obj, IPMatch):
+        return obj.to_dict()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _write_json_atomic(path: Path, data: Any):
+    """Write data as JSON through a temp file and os.replace.
+    
+    A crash mid-write leaves the previous file intact instead of a
+    truncated one.
+    """
+    tmp_path = path.with_name(path.name + ".tmp")
+    tmp_path.write_bytes(jsonio.dumps(data, default=json_default))
+    os.replace(tmp_path, path)
+
+
+# Files at least this large are parsed straight from a memory map; below
+# it the extra syscalls cost more than the copy they save
+_MMAP_MIN_SIZE = 256 * 1024
+
+
+def _load_json_file(path: Path) -> Any:
+    """Decode a JSON file, memory-mapping large files when orjson is available."""
+    if jsonio.ORJSON_AVAILABLE and path.stat().st_size >= _MMAP_MIN_SIZE:
+        with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            with memoryview(mm) as view:
+                return jsonio.loads(view)
+    return jsonio.loads(path.read_bytes())
+
+
+# Serializes read-modify-write cycles of the lost inventions index
+_INDEX_LOCK = threading.Lock()
+
 
 class IPExtractor:
     """Extracts abandoned intellectual property from conversations."""
@@ -27,65 +388,59 @@ class IPExtractor:
         self.logger = logging.getLogger(__name__)
         
         # IP detection patterns
-        self.ip_patterns = {
-            "product_ideas": [
-                r"build\s+(?:a|an)\s+([^.!?]+)",
-                r"create\s+(?:a|an)\s+([^.!?]+)",
-                r"develop\s+(?:a|an)\s+([^.!?]+)",
-                r"invent\s+(?:a|an)\s+([^.!?]+)",
-                r"design\s+(?:a|an)\s+([^.!?]+)",
-                r"app\s+(?:that|which)\s+([^.!?]+)",
-                r"platform\s+(?:that|which)\s+([^.!?]+)",
-                r"system\s+(?:that|which)\s+([^.!?]+)",
-                r"tool\s+(?:that|which)\s+([^.!?]+)",
-                r"service\s+(?:that|which)\s+([^.!?]+)"
-            ],
-            "workflows": [
-                r"workflow\s+(?:for|to)\s+([^.!?]+)",
-                r"process\s+(?:for|to)\s+([^.!?]+)",
-                r"method\s+(?:for|to)\s+([^.!?]+)",
-                r"approach\s+(?:for|to)\s+([^.!?]+)",
-                r"strategy\s+(?:for|to)\s+([^.!?]+)"
-            ],
-            "brands_names": [
-                r"brand\s+(?:name|called)\s+([^.!?]+)",
-                r"company\s+(?:name|called)\s+([^.!?]+)",
-                r"product\s+(?:name|called)\s+([^.!?]+)",
-                r"service\s+(?:name|called)\s+([^.!?]+)"
-            ],
-            "schemas": [
-                r"schema\s+(?:for|of)\s+([^.!?]+)",
-                r"structure\s+(?:for|of)\s+([^.!?]+)",
-                r"framework\s+(?:for|of)\s+([^.!?]+)",
-                r"architecture\s+(?:for|of)\s+([^.!?]+)"
-            ],
-            "abandoned_ideas": [
-                r"abandoned\s+([^.!?]+)",
-                r"gave\s+up\s+on\s+([^.!?]+)",
-                r"stopped\s+working\s+on\s+([^.!?]+)",
-                r"never\s+finished\s+([^.!?]+)",
-                r"left\s+behind\s+([^.!?]+)",
-                r"forgot\s+about\s+([^.!?]+)"
-            ]
-        }
+        self.max_tail_len = config.get("ip_max_tail_len", DEFAULT_MAX_TAIL_LEN)
+        self.ip_patterns = _full_patterns(self.max_tail_len)
+        
+        # re2 guarantees linear-time matching on untrusted text, but its
+        # Python binding is slower than re on typical conversations
+        self.regex_engine = config.get("ip_regex_engine", "re")
+        if self.regex_engine == "re2" and not RE2_AVAILABLE:
+            self.logger.warning("⚠️ re2 not installed, falling back to the re engine")
+            self.regex_engine = "re"
+        self._patterns = _pattern_table(self.regex_engine, self.max_tail_len)
+        self._patterns_ignore_case = _pattern_table(self.regex_engine, self.max_tail_len, ignore_case=True)
+        self._pattern_types = tuple(ip_type for ip_type, _, _, _ in self._patterns)
+        # Pattern sources by pattern id. Results only carry a short version
+        # hash of the legend; the legend itself is saved once in patterns.json.
+        self._pattern_legend = tuple(pattern for _, pattern, _, _ in self._patterns)
+        self._pattern_version = hashlib.blake2b(
+            "\n".join(self._pattern_legend).encode('utf-8'), digest_size=8
+        ).hexdigest()
+        self._match_at_hits = _build_hit_matcher(self._patterns)
+        self._match_at_hits_ignore_case = _build_hit_matcher(self._patterns_ignore_case)
         
         # Setup paths
         self.lost_inventions_dir = Path("data/resurrection/lost_inventions")
         self.lost_inventions_dir.mkdir(parents=True, exist_ok=True)
+        self._index_file = self.lost_inventions_dir / "index.json"
+        self._patterns_file = self.lost_inventions_dir / "patterns.json"
+        self._legend_saved = False
         
-    def extract_ip_from_conversation(self, conversation_data: Dict[str, Any], conversation_id: str) -> Dict[str, Any]:
+        # Index entries saved inside batch_index(), written when it exits
+        self._index_batch_depth = 0
+        self._pending_index: Dict[str, Dict[str, Any]] = {}
+        
+        # ISO timestamp reused for extractions within the same second
+        self._timestamp = ""
+        self._timestamp_at = float("-inf")
+        
+    def extract_ip_from_conversation(self, conversation_data: Dict[str, Any], conversation_id: str,
+                                     extracted_at: Optional[str] = None) -> Dict[str, Any]:
         """Extract IP from a single conversation.
         
         Args:
             conversation_data: The conversation data
             conversation_id: The conversation ID
+            extracted_at: ISO timestamp to record (defaults to now, to the second)
             
         Returns:
             Dictionary containing extracted IP
         """
         extracted_ip = {
             "conversation_id": conversation_id,
-            "extracted_at": datetime.now().isoformat(),
+            "extracted_at": extracted_at or self._current_timestamp(),
+            "regex_engine": self.regex_engine,
+            "pattern_version": self._pattern_version,
             "product_ideas": [],
             "workflows": [],
             "brands_names": [],
@@ -99,18 +454,36 @@ class IPExtractor:
         # Extract text content from conversation
         content = self._extract_conversation_text(conversation_data)
         
+        # Hyperscan folds case itself and reports byte offsets, which only
+        # equal string offsets for ASCII text. Its hits are confirmed with
+        # case-insensitive match() calls, which are cheap at a fixed position.
+        if HYPERSCAN_DATABASE is not None and self.regex_engine == "re" and content.isascii():
+            found = self._match_at_hits_ignore_case(content, self._hyperscan_hits(content))
+        else:
+            # Otherwise fold case once for the whole text rather than on every
+            # match attempt; captures are sliced from the original to keep
+            # their case. lower() can change the length of some non-ASCII
+            # text, after which offsets no longer line up with the original.
+            # The re2 binding re-encodes the text on every call, so it only
+            # does full scans.
+            content_lc = content.lower()
+            if len(content_lc) != len(content):
+                found = self._scan_patterns(content, content_lc, self._patterns_ignore_case)
+            elif KEYWORD_AUTOMATON is not None and self.regex_engine == "re":
+                found = self._match_at_hits(content_lc, self._keyword_hits(content_lc))
+            else:
+                found = self._scan_patterns(content_lc, content_lc, self._patterns)
+        
         # Apply IP detection patterns
-        for ip_type, patterns in self.ip_patterns.items():
-            for pattern in patterns:
-                matches = re.findall(pattern, content, re.IGNORECASE)
-                for match in matches:
-                    cleaned_match = match.strip()
-                    if len(cleaned_match) > 10:  # Filter out very short matches
-                        extracted_ip[ip_type].append({
-                            "text": cleaned_match,
-                            "pattern": pattern,
-                            "confidence": self._calculate_confidence(cleaned_match)
-                        })
+        calculate_confidence = self._calculate_confidence
+        for pattern_id, (ip_type, spans) in enumerate(zip(self._pattern_types, found)):
+            if not spans:
+                continue
+            bucket = extracted_ip[ip_type]
+            for start, end in spans:
+                cleaned_match = content[start:end].strip()
+                if len(cleaned_match) > 10:  # Filter out very short matches
+                    bucket.append(IPMatch(cleaned_match, pattern_id, calculate_confidence(cleaned_match)))
         
         # Calculate potential value
         extracted_ip["potential_value"] = self._calculate_potential_value(extracted_ip)
@@ -123,110 +496,125 @@ class IPExtractor:
         
         return extracted_ip
     
+    def _current_timestamp(self) -> str:
+        """Return the current time in ISO format, refreshed at most once per second."""
+        now = time.monotonic()
+        if now - self._timestamp_at >= 1.0:
+            self._timestamp = datetime.now().isoformat()
+            self._timestamp_at = now
+        return self._timestamp
+    
+    def extract_ip_batch(self, conversations: Iterable[Tuple[str, Dict[str, Any]]],
+                         max_workers: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Extract IP from many conversations in parallel.
+        
+        Extraction is CPU-bound and independent per conversation, so the
+        work is spread over a process pool in chunks. All results share the
+        batch start time as their extraction time.
+        
+        Args:
+            conversations: (conversation_id, conversation_data) pairs
+            max_workers: Number of worker processes (defaults to the CPU count)
+            
+        Returns:
+            Extracted IP dictionaries in input order
+        """
+        items = list(conversations)
+        workers = max_workers or os.cpu_count() or 1
+        extracted_at = datetime.now().isoformat()
+        
+        if workers == 1 or len(items) <= 1:
+            return [
+                self.extract_ip_from_conversation(data, conversation_id, extracted_at)
+                for conversation_id, data in items
+            ]
+        
+        chunksize = max(1, len(items) // (4 * workers))
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_batch_worker,
+                                 initargs=(self.config,)) as executor:
+            return list(executor.map(_extract_in_worker, items, repeat(extracted_at), chunksize=chunksize))
+    
+    def _scan_patterns(self, text: str, content_lc: str,
+                       patterns: Tuple[Tuple[str, str, str, Any], ...]) -> List[List[Tuple[int, int]]]:
+        """Run every pattern over the whole text.
+        
+        Patterns whose keyword does not occur at all are skipped.
+        
+        Args:
+            text: The text to match, lowercased unless patterns ignore case
+            content_lc: The lowercased conversation text
+            patterns: Pattern table to match with
+            
+        Returns:
+            Capture spans, one list per pattern id
+        """
+        return [
+            [m.span(1) for m in compiled.finditer(text)] if keyword in content_lc else []
+            for _, _, keyword, compiled in patterns
+        ]
+    
+    def _keyword_hits(self, content_lc: str) -> Iterable[Tuple[int, Tuple[int, ...]]]:
+        """Yield (start, pattern_ids) for every keyword occurrence.
+        
+        One Aho-Corasick pass over the text finds the keywords of all IP
+        types at once.
+        """
+        for end, (length, pattern_ids) in KEYWORD_AUTOMATON.iter(content_lc):
+            yield end - length + 1, pattern_ids
+    
+    def _hyperscan_hits(self, content: str) -> List[Tuple[int, Tuple[int, ...]]]:
+        """Return (start, pattern_ids) for every pattern prefix match, by start."""
+        hits = []
+        
+        def on_match(pattern_id, start, end, flags, context):
+            hits.append((start, (pattern_id,)))
+        
+        HYPERSCAN_DATABASE.scan(content.encode("ascii"), match_event_handler=on_match)
+        hits.sort()
+        return hits
+    
     def _extract_conversation_text(self, conversation_data: Dict[str, Any]) -> str:
         """Extract all text content from conversation."""
-        content_parts = []
-        
-        # Extract from messages if available
-        if "messages" in conversation_data:
-            for message in conversation_data["messages"]:
-                if "content" in message:
-                    content_parts.append(message["content"])
-        
-        # Extract from summary if available
-        if "summary" in conversation_data:
-            content_parts.append(conversation_data["summary"])
-        
-        # Extract from topics if available
-        if "topics" in conversation_data:
-            for topic in conversation_data["topics"]:
-                if isinstance(topic, dict) and "topic" in topic:
-                    content_parts.append(topic["topic"])
-                elif isinstance(topic, str):
-                    content_parts.append(topic)
-        
-        # Extract from entities if available
-        if "entities" in conversation_data:
-            for entity in conversation_data["entities"]:
-                if isinstance(entity, dict) and "name" in entity:
-                    content_parts.append(entity["name"])
-        
-        # Extract from action items if available
-        if "action_items" in conversation_data:
-            for action in conversation_data["action_items"]:
-                if isinstance(action, dict) and "action" in action:
-                    content_parts.append(action["action"])
-        
-        # Extract from decisions if available
-        if "decisions" in conversation_data:
-            for decision in conversation_data["decisions"]:
-                if isinstance(decision, dict) and "decision" in decision:
-                    content_parts.append(decision["decision"])
+        # Messages dominate long conversations and are always dicts
+        content_parts = [
+            message["content"] for message in conversation_data.get("messages") or () if "content" in message
+        ]
+        
+        for key, field, accepts_str in TEXT_SOURCES:
+            items = conversation_data.get(key)
+            if not items:
+                continue
+            if field is None:
+                content_parts.append(items)
+            else:
+                content_parts.extend(filter(None, (
+                    item.get(field) if isinstance(item, dict) else (item if accepts_str and isinstance(item, str) else None)
+                    for item in items
+                )))
         
         return " ".join(content_parts)
     
     def _calculate_confidence(self, text: str) -> float:
         """Calculate confidence score for extracted IP."""
         # Simple heuristic: longer, more detailed descriptions get higher confidence
-        words = len(text.split())
-        if words > 20:
-            return 0.9
-        elif words > 10:
-            return 0.7
-        elif words > 5:
-            return 0.5
-        else:
-            return 0.3
+        words = len(text.split(None, _CONFIDENCE_MAX_SPLIT))
+        return _CONFIDENCE_LEVELS[bisect_left(_CONFIDENCE_WORD_STEPS, words)]
     
     def _calculate_potential_value(self, extracted_ip: Dict[str, Any]) -> int:
         """Calculate potential monetary value of extracted IP."""
-        value = 0
-        
-        # Product ideas are high value
-        value += len(extracted_ip["product_ideas"]) * 10000
-        
-        # Workflows are medium value
-        value += len(extracted_ip["workflows"]) * 5000
-        
-        # Brand names are medium value
-        value += len(extracted_ip["brands_names"]) * 3000
-        
-        # Schemas are high value
-        value += len(extracted_ip["schemas"]) * 8000
-        
-        # Abandoned ideas are highest value (lost opportunity)
-        value += len(extracted_ip["abandoned_ideas"]) * 15000
-        
-        return value
+        return sum(len(extracted_ip[ip_type]) * value for ip_type, value in IP_VALUES.items())
     
-    def _generate_tags(self, extracted_ip: Dict[str, Any]) -> List[str]:
-        """Generate tags for the extracted IP."""
-        tags = []
-        
-        # Add tags based on IP types found
-        if extracted_ip["product_ideas"]:
-            tags.append("product-ideas")
-        if extracted_ip["workflows"]:
-            tags.append("workflows")
-        if extracted_ip["brands_names"]:
-            tags.append("brand-names")
-        if extracted_ip["schemas"]:
-            tags.append("schemas")
-        if extracted_ip["abandoned_ideas"]:
-            tags.append("abandoned")
-            tags.append("high-value")
-        
-        # Add value-based tags
-        if extracted_ip["potential_value"] > 50000:
-            tags.append("premium")
-        elif extracted_ip["potential_value"] > 20000:
-            tags.append("valuable")
-        elif extracted_ip["potential_value"] > 5000:
-            tags.append("moderate")
-        else:
-            tags.append("low-value")
+    def _generate_tags(self, extracted_ip: Dict[str, Any]) -> Tuple[str, ...]:
+        """Generate tags for the extracted IP.
         
-        return tags
+        The tags depend only on which IP types were found and on the value
+        bin, so they are looked up in a precomputed table by bitmask.
+        """
+        mask = bisect_left(_VALUE_THRESHOLDS, extracted_ip["potential_value"]) << len(_CATEGORY_TAGS)
+        for bit, (ip_type, _) in enumerate(_CATEGORY_TAGS):
+            if extracted_ip[ip_type]:
+                mask |= 1 << bit
+        return _TAG_TABLE[mask]
     
     def _generate_ip_summary(self, extracted_ip: Dict[str, Any]) -> str:
         """Generate a summary of the extracted IP."""
@@ -268,8 +656,12 @@ class IPExtractor:
         try:
             ip_file = self.lost_inventions_dir / f"{conversation_id}_ip.json"
             
-            with open(ip_file, 'w', encoding='utf-8') as f:
-                json.dump(extracted_ip, f, indent=2, ensure_ascii=False)
+            _write_json_atomic(ip_file, extracted_ip)
+            
+            if not self._legend_saved:
+                self._save_pattern_legend()
+            
+            self._update_index(conversation_id, extracted_ip)
                 
             self.logger.info(f"Saved IP extraction for conversation {conversation_id}")
             return True
@@ -293,47 +685,155 @@ class IPExtractor:
             if not ip_file.exists():
                 return None
                 
-            with open(ip_file, 'r', encoding='utf-8') as f:
-                return json.load(f)
+            return _load_json_file(ip_file)
                 
         except Exception as e:
             self.logger.error(f"Failed to load IP extraction for {conversation_id}: {e}")
             return None
     
+    def _load_pattern_legends(self) -> Dict[str, List[str]]:
+        """Load the saved pattern legends by version."""
+        try:
+            return jsonio.loads(self._patterns_file.read_bytes())
+        except FileNotFoundError:
+            return {}
+    
+    def _save_pattern_legend(self):
+        """Record this extractor's pattern legend in patterns.json if it is missing."""
+        with _INDEX_LOCK:
+            legends = self._load_pattern_legends()
+            if self._pattern_version not in legends:
+                legends[self._pattern_version] = list(self._pattern_legend)
+                _write_json_atomic(self._patterns_file, legends)
+        self._legend_saved = True
+    
+    def get_pattern_legend(self, pattern_version: Optional[str] = None) -> Optional[Tuple[str, ...]]:
+        """Return the pattern sources that pattern ids refer to.
+        
+        Args:
+            pattern_version: The "pattern_version" of an extraction result
+                (defaults to this extractor's version)
+            
+        Returns:
+            Pattern sources in pattern-id order, or None if the version is unknown
+        """
+        if pattern_version is None or pattern_version == self._pattern_version:
+            return self._pattern_legend
+        legend = self._load_pattern_legends().get(pattern_version)
+        return tuple(legend) if legend is not None else None
+    
+    def _index_entry(self, extracted_ip: Dict[str, Any]) -> Dict[str, Any]:
+        """Reduce extracted IP to the fields the summary needs."""
+        return {
+            "value": extracted_ip.get("potential_value", 0),
+            "counts": {key: len(extracted_ip.get(key, [])) for key in IP_CATEGORIES},
+            "tags": extracted_ip.get("tags", [])
+        }
+    
+    def _load_index(self) -> Optional[Dict[str, Dict[str, Any]]]:
+        """Load the lost inventions index, or None if it does not exist yet."""
+        try:
+            return jsonio.loads(self._index_file.read_bytes())
+        except FileNotFoundError:
+            return None
+    
+    def _write_index(self, index: Dict[str, Dict[str, Any]]):
+        """Write the index atomically so readers never see a partial file."""
+        _write_json_atomic(self._index_file, index)
+    
+    def _scan_ip_files(self) -> Dict[str, Dict[str, Any]]:
+        """Build index entries from every saved IP file.
+        
+        Files are read on a thread pool since disk reads and orjson parsing
+        release the GIL.
+        """
+        ip_files = list(self.lost_inventions_dir.glob("*_ip.json"))
+        
+        with ThreadPoolExecutor() as executor:
+            entries = executor.map(lambda ip_file: self._index_entry(_load_json_file(ip_file)), ip_files)
+            return {ip_file.name[:-len("_ip.json")]: entry for ip_file, entry in zip(ip_files, entries)}
+    
+    @contextmanager
+    def batch_index(self):
+        """
+        Defer index updates until the outermost batch exits.
+        
+        Every save otherwise rewrites the whole index, so saving many
+        conversations in a row costs quadratic I/O; inside a batch the index
+        is written once at the end.
+        
+        Example:
+            with extractor.batch_index():
+                for conversation_id, extracted_ip in results:
+                    extractor.save_extracted_ip(extracted_ip, conversation_id)
+        """
+        self._index_batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._index_batch_depth -= 1
+            if self._index_batch_depth == 0 and self._pending_index:
+                pending, self._pending_index = self._pending_index, {}
+                self._flush_index(pending)
+    
+    def _update_index(self, conversation_id: str, extracted_ip: Dict[str, Any]):
+        """Record one conversation in the index, or queue it inside batch_index()."""
+        entry = self._index_entry(extracted_ip)
+        if self._index_batch_depth:
+            self._pending_index[conversation_id] = entry
+        else:
+            self._flush_index({conversation_id: entry})
+    
+    def _flush_index(self, entries: Dict[str, Dict[str, Any]]):
+        """Merge entries into the index in one atomic rewrite, backfilling it on first use."""
+        with _INDEX_LOCK:
+            index = self._load_index()
+            if index is None:
+                index = self._scan_ip_files()
+            index.update(entries)
+            self._write_index(index)
+    
+    def rebuild_index(self) -> int:
+        """Rebuild the lost inventions index from the saved IP files.
+        
+        Only needed for IP files written before the index existed or
+        changed outside of save_extracted_ip.
+        
+        Returns:
+            Number of conversations in the rebuilt index
+        """
+        with _INDEX_LOCK:
+            index = self._scan_ip_files()
+            self._write_index(index)
+        return len(index)
+    
     def get_lost_inventions_summary(self) -> Dict[str, Any]:
         """Get a summary of all lost inventions.
         
+        Reads the small index maintained by save_extracted_ip instead of
+        every IP file.
+        
         Returns:
             Dictionary with summary statistics
         """
         try:
-            ip_files = list(self.lost_inventions_dir.glob("*_ip.json"))
-            
-            total_value = 0
-            total_ideas = 0
-            abandoned_count = 0
-            high_value_count = 0
+            index = self._load_index()
+            if index is None:
+                self.rebuild_index()
+                index = self._load_index()
+            if self._pending_index:
+                index.update(self._pending_index)
             
-            for ip_file in ip_files:
-                with open(ip_file, 'r', encoding='utf-8') as f:
-                    ip_data = json.load(f)
-                    
-                    total_value += ip_data.get("potential_value", 0)
-                    total_ideas += sum(len(ip_data.get(key, [])) for key in ["product_ideas", "workflows", "brands_names", "schemas", "abandoned_ideas"])
-                    
-                    if "abandoned" in ip_data.get("tags", []):
-                        abandoned_count += 1
-                    
-                    if ip_data.get("potential_value", 0) > 20000:
-                        high_value_count += 1
+            entries = index.values()
+            total_value = sum(entry["value"] for entry in entries)
             
             return {
-                "total_conversations_analyzed": len(ip_files),
+                "total_conversations_analyzed": len(index),
                 "total_potential_value": total_value,
-                "total_ideas_extracted": total_ideas,
-                "abandoned_ideas_count": abandoned_count,
-                "high_value_ideas_count": high_value_count,
-                "average_value_per_conversation": total_value / len(ip_files) if ip_files else 0
+                "total_ideas_extracted": sum(sum(entry["counts"].values()) for entry in entries),
+                "abandoned_ideas_count": sum(1 for entry in entries if "abandoned" in entry["tags"]),
+                "high_value_ideas_count": sum(1 for entry in entries if entry["value"] > 20000),
+                "average_value_per_conversation": total_value / len(index) if index else 0
             }
             
         except Exception as e:
@@ -345,4 +845,20 @@ class IPExtractor:
                 "abandoned_ideas_count": 0,
                 "high_value_ideas_count": 0,
                 "average_value_per_conversation": 0
-            } 
\ No newline at end of file
+            }
+
+
+# Extractor owned by each extract_ip_batch worker process
+_worker_extractor: Optional[IPExtractor] = None
+
+
+def _init_batch_worker(config: Dict[str, Any]):
+    """Create the per-process extractor for extract_ip_batch."""
+    global _worker_extractor
+    _worker_extractor = IPExtractor(config)
+
+
+def _extract_in_worker(item: Tuple[str, Dict[str, Any]], extracted_at: str) -> Dict[str, Any]:
+    """Extract IP from one (conversation_id, conversation_data) pair in a worker."""
+    conversation_id, conversation_data = item
+    return _worker_extractor.extract_ip_from_conversation(conversation_data, conversation_id, extracted_at)
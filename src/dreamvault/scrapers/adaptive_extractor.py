@@ -4,17 +4,160 @@ Adaptive Conversation Extractor for DreamVault
 Self-healing system that adapts to ChatGPT interface changes.
 """
 
-import time
-import json
+import os
+import re
 import logging
+import tempfile
+from concurrent.futures import Future, ThreadPoolExecutor
 from typing import List, Dict, Optional, Tuple
+from urllib.parse import urljoin
+import requests
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
+from selenium.common.exceptions import TimeoutException, NoSuchElementException, StaleElementReferenceException
+
+from ..utils import jsonio
+
+try:
+    import lxml.html
+    LXML_AVAILABLE = True
+except ImportError:
+    LXML_AVAILABLE = False
 
 logger = logging.getLogger(__name__)
 
+# Browser-side helpers shared by the scripts below. findElements runs a
+# CSS selector, or an XPath when `by` is "xpath". conversationLink returns
+# [href, title] when an element is a link to a conversation; selectors
+# target the anchor itself, so no parent lookup is needed.
+_SCRIPT_HELPERS = """
+function findElements(selector, by) {
+    if (by !== 'xpath') {
+        return Array.from(document.querySelectorAll(selector));
+    }
+    const result = document.evaluate(selector, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+    const elements = [];
+    for (let i = 0; i < result.snapshotLength; i++) {
+        elements.push(result.snapshotItem(i));
+    }
+    return elements;
+}
+function conversationLink(element) {
+    const href = element.href;
+    const title = (element.innerText || '').trim();
+    return typeof href === 'string' && title && href.indexOf('/c/') >= 0 ? [href, title] : null;
+}
+"""
+
+# Returns [href, title] for every conversation link a selector matches, in
+# one WebDriver round-trip instead of several per element
+_COLLECT_LINKS_SCRIPT = _SCRIPT_HELPERS + """
+return findElements(arguments[0], arguments[1]).map(conversationLink).filter(Boolean);
+"""
+
+# Counts the elements a selector matches, for polling
+_COUNT_MATCHES_SCRIPT = _SCRIPT_HELPERS + """
+return findElements(arguments[0], arguments[1]).length;
+"""
+
+# Counts the conversation links each of several [selector, by] pairs
+# matches in one call; -1 marks a selector the browser rejected
+_PREFLIGHT_SCRIPT = _SCRIPT_HELPERS + """
+return arguments[0].map(([selector, by]) => {
+    try {
+        return findElements(selector, by).filter(conversationLink).length;
+    } catch (e) {
+        return -1;
+    }
+});
+"""
+
+# Elements that may hold the scrollable conversation list
+_SCROLL_CONTAINERS = "nav, div[class*='conversation'], div[class*='sidebar']"
+_SCROLL_CONTAINERS_SCRIPT = """
+for (const container of arguments[0]) {
+    container.scrollTop = container.scrollHeight;
+}
+"""
+
+# Comprehensive selector library; cached selectors are tried before these
+_SELECTOR_LIBRARY = {
+    "conversation_links": (
+        'a[href*="/c/"]',
+        'nav a[href*="/c/"]',
+        'a[href*="chatgpt.com/c/"]',
+        'a[href*="chat.openai.com/c/"]',
+        'div[class*="conversation"] a[href*="/c/"]',
+        'nav div[class*="conversation"] a',
+        'div[class*="conversation"] div[class*="title"] a',
+        'div[class*="conversation"] a',
+        'div[class*="group"] a[href*="/c/"]',
+        'div[class*="flex"] a[href*="/c/"]',
+        # XPath fallbacks for links whose title sits in a span
+        "//a[contains(@href, '/c/') and normalize-space(.) != '']",
+        "//nav//a[.//span[normalize-space()]]"
+    ),
+    "url_patterns": (
+        "https://chatgpt.com",
+        "https://chat.openai.com",
+        "https://chatgpt.co"
+    )
+}
+
+# Longest wait for new conversations after a scroll; matches the old fixed pause
+_SCROLL_WAIT_SECONDS = 3
+
+# Longest wait for a page or the conversation sidebar to load
+_PAGE_WAIT_SECONDS = 5
+
+
+def _probe_urls_fast(urls: List[str], timeout: float = 3) -> List[str]:
+    """
+    Check candidate URLs with concurrent HEAD requests.
+    
+    A browser navigation costs seconds, so URLs that do not answer at all
+    are dropped before the browser tries them. Bot protection often answers
+    plain HTTP clients with 401, 403 or 405, so any response counts as
+    reachable and keeps its place; only URLs whose server is failing (5xx)
+    move behind the rest.
+    
+    Args:
+        urls: Candidate URLs in order of preference
+        timeout: Timeout for each request in seconds
+        
+    Returns:
+        Reachable URLs in input order, server errors last
+    """
+    def head(session, url):
+        try:
+            return session.head(url, timeout=timeout, allow_redirects=True).status_code
+        except requests.RequestException:
+            return None
+    
+    with requests.Session() as session, ThreadPoolExecutor(max_workers=len(urls) or 1) as executor:
+        statuses = list(executor.map(lambda url: head(session, url), urls))
+    
+    reachable = [(status >= 500, url) for url, status in zip(urls, statuses) if status is not None]
+    # sorted() is stable, so URLs within a bucket keep the caller's priority
+    return [url for _, url in sorted(reachable, key=lambda item: item[0])]
+
+
+def _is_chat_page(driver) -> bool:
+    """Return whether the loaded page looks like ChatGPT."""
+    title = driver.title.lower()
+    return "chat" in title or "gpt" in title
+
+
+# Conversation id in a conversation URL; a match also marks the link as one
+ID_RE = re.compile(r"/c/([A-Za-z0-9-]+)")
+
+
+def _selector_by(selector: str) -> str:
+    """Return the locator strategy for a selector; XPath ones start with a path."""
+    return By.XPATH if selector.startswith(("/", "(")) else By.CSS_SELECTOR
+
+
 class AdaptiveExtractor:
     """Self-healing conversation extractor that adapts to interface changes."""
     
@@ -30,97 +173,105 @@ class AdaptiveExtractor:
         self.selector_cache_file = selector_cache_file
         self.successful_selectors = self._load_selector_cache()
         
-        # Comprehensive selector library
-        self.selector_library = {
-            "conversation_links": [
-                "//a[contains(@href, '/c/')]//span",
-                "//a[contains(@href, '/c/')]",
-                "//div[contains(@class, 'conversation')]//a",
-                "//nav//a[contains(@href, '/c/')]",
-                "//a[contains(@href, 'chatgpt.com/c/')]",
-                "//a[contains(@href, 'chat.openai.com/c/')]",
-                "//div[contains(@class, 'group')]//a[contains(@href, '/c/')]",
-                "//div[contains(@class, 'flex')]//a[contains(@href, '/c/')]",
-                "//nav//div[contains(@class, 'conversation')]//a",
-                "//div[contains(@class, 'conversation')]//div[contains(@class, 'title')]//a",
-                "//a[contains(@href, '/c/')]//div[contains(@class, 'text')]",
-                "//div[contains(@class, 'conversation')]//a[contains(@href, '/c/')]",
-                "//nav//div[contains(@class, 'conversation')]//a",
-                "//div[contains(@class, 'conversation')]//div[contains(@class, 'title')]//a",
-                "//a[contains(@href, '/c/')]//span",
-                "//div[contains(@class, 'conversation')]//span",
-                "//nav//span",
-                "//a[contains(@href, '/c/')]//div",
-                "//div[contains(@class, 'conversation')]//div",
-                "//nav//div"
-            ],
-            "url_patterns": [
-                "https://chatgpt.com",
-                "https://chat.openai.com",
-                "https://chatgpt.co"
-            ]
-        }
+        # Cache writes run on one background thread; a newer save replaces
+        # a write that has not started yet
+        self._cache_dir_ready = False
+        self._save_executor: Optional[ThreadPoolExecutor] = None
+        self._pending_save: Optional[Future] = None
+        
+        # Comprehensive selector library, shared by every instance
+        self.selector_library = _SELECTOR_LIBRARY
+        self._probe_order = self._build_probe_order()
     
     def _load_selector_cache(self) -> Dict[str, List[str]]:
         """Load cached successful selectors."""
         try:
             if self.selector_cache_file and self.selector_cache_file:
-                with open(self.selector_cache_file, 'r') as f:
-                    cache = json.load(f)
+                with open(self.selector_cache_file, 'rb') as f:
+                    cache = jsonio.loads(f.read())
                     logger.info(f"📊 Loaded {len(cache.get('selectors', []))} cached selectors")
                     return cache
         except Exception as e:
             logger.warning(f"Failed to load selector cache: {e}")
         return {"selectors": [], "urls": []}
     
+    def _build_probe_order(self) -> List[str]:
+        """Return cached selectors followed by the library, without duplicates."""
+        return list(dict.fromkeys([*self.successful_selectors.get("selectors", []), *self.selector_library["conversation_links"]]))
+    
     def _save_selector_cache(self):
-        """Save successful selectors to cache."""
+        """Save successful selectors to cache in the background."""
+        self._probe_order = self._build_probe_order()
+        snapshot = {key: list(value) for key, value in self.successful_selectors.items()}
+        
+        if self._pending_save is not None:
+            self._pending_save.cancel()
+        if self._save_executor is None:
+            self._save_executor = ThreadPoolExecutor(max_workers=1)
+        self._pending_save = self._save_executor.submit(self._write_selector_cache, snapshot)
+    
+    def _write_selector_cache(self, cache: Dict[str, List[str]]):
+        """Write the selector cache atomically through a temp file."""
         try:
-            import os
-            os.makedirs(os.path.dirname(self.selector_cache_file), exist_ok=True)
-            with open(self.selector_cache_file, 'w') as f:
-                json.dump(self.successful_selectors, f, indent=2)
+            directory = os.path.dirname(self.selector_cache_file) or "."
+            if not self._cache_dir_ready:
+                os.makedirs(directory, exist_ok=True)
+                self._cache_dir_ready = True
+            
+            fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+            try:
+                with os.fdopen(fd, 'wb') as f:
+                    # Compact; the cache is only read back by the extractor
+                    f.write(jsonio.dumps(cache))
+                os.replace(tmp_path, self.selector_cache_file)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
             logger.info("💾 Saved selector cache")
         except Exception as e:
             logger.error(f"Failed to save selector cache: {e}")
     
-    def _test_selector(self, driver, selector: str) -> Tuple[bool, List]:
-        """Test a selector and return success status and elements."""
+    def flush_selector_cache(self):
+        """Wait for a pending selector cache write to finish."""
+        if self._pending_save is not None:
+            try:
+                self._pending_save.result()
+            except Exception:
+                pass
+            self._pending_save = None
+    
+    def _test_selector(self, driver, selector: str,
+                       by: str = By.CSS_SELECTOR) -> Tuple[bool, List[List[str]]]:
+        """Test a selector and return success status and (href, title) pairs."""
         try:
-            elements = driver.find_elements(By.XPATH, selector)
-            if elements:
-                # Validate elements contain conversation data
-                valid_elements = []
-                for element in elements:
-                    try:
-                        if element.tag_name == "span":
-                            parent = element.find_element(By.XPATH, "./..")
-                            href = parent.get_attribute("href")
-                        else:
-                            href = element.get_attribute("href")
-                        
-                        text = element.text.strip()
-                        if href and text and "/c/" in href:
-                            valid_elements.append(element)
-                    except:
-                        continue
-                
-                return len(valid_elements) > 0, valid_elements
-            return False, []
+            links = driver.execute_script(_COLLECT_LINKS_SCRIPT, selector, by) or []
+            return len(links) > 0, links
         except Exception as e:
             logger.debug(f"Selector failed: {selector} - {e}")
             return False, []
     
+    def _load_chat_page(self, driver, url: str) -> bool:
+        """Open a URL and wait until it shows a ChatGPT page."""
+        driver.get(url)
+        try:
+            WebDriverWait(driver, _PAGE_WAIT_SECONDS).until(_is_chat_page)
+            return True
+        except TimeoutException:
+            return False
+    
     def _discover_working_url(self, driver) -> str:
-        """Discover the working ChatGPT URL."""
-        for url_pattern in self.selector_library["url_patterns"]:
+        """Discover the working ChatGPT URL and leave it loaded, trying the cached one first."""
+        cached_urls = self.successful_selectors.get("urls") or []
+        candidates = list(dict.fromkeys([*cached_urls[:1], *self.selector_library["url_patterns"]]))
+        
+        # Skip URLs that do not answer at all; if none do, the browser may
+        # still reach them (e.g. through its own proxy), so try them all
+        candidates = _probe_urls_fast(candidates) or candidates
+        
+        for url_pattern in candidates:
             try:
                 logger.info(f"🔍 Testing URL: {url_pattern}")
-                driver.get(url_pattern)
-                time.sleep(3)
-                
-                # Check if page loaded successfully
-                if "chat" in driver.title.lower() or "gpt" in driver.title.lower():
+                if self._load_chat_page(driver, url_pattern):
                     logger.info(f"✅ Found working URL: {url_pattern}")
                     return url_pattern
                     
@@ -129,38 +280,11 @@ class AdaptiveExtractor:
                 continue
         
         # Default fallback
+        driver.get("https://chatgpt.com")
         return "https://chatgpt.com"
     
-    def _extract_conversations_from_elements(self, elements: List) -> List[Dict[str, str]]:
-        """Extract conversation data from elements."""
-        conversations = []
-        
-        for i, element in enumerate(elements):
-            try:
-                # Get the parent link element if we're on a span
-                if element.tag_name == "span":
-                    parent = element.find_element(By.XPATH, "./..")
-                    href = parent.get_attribute("href")
-                else:
-                    href = element.get_attribute("href")
-                
-                title = element.text.strip()
-                
-                if href and title and "/c/" in href:
-                    conversation = {
-                        "id": href.split("/c/")[-1] if "/c/" in href else f"conv_{i}",
-                        "title": title,
-                        "url": href
-                    }
-                    conversations.append(conversation)
-                    
-            except Exception as e:
-                logger.warning(f"Failed to extract conversation {i}: {e}")
-                continue
-        
-        return conversations
-    
-    def _extract_conversations_with_scrolling(self, driver, selector: str) -> List[Dict[str, str]]:
+    def _extract_conversations_with_scrolling(self, driver, selector: str,
+                                              by: str = By.CSS_SELECTOR) -> List[Dict[str, str]]:
         """Extract conversations with infinite scrolling."""
         logger.info("🔄 Starting infinite scroll to load all conversations...")
         conversations = []
@@ -170,41 +294,37 @@ class AdaptiveExtractor:
         last_count = 0
         no_new_conversations_count = 0
         
+        # The scrollable containers are looked up once and reused
+        containers = driver.find_elements(By.CSS_SELECTOR, _SCROLL_CONTAINERS)
+        
+        # Bound once; the loop below runs for every link on every scroll
+        add = seen_urls.add
+        append = conversations.append
+        search = ID_RE.search
+        
         while scroll_attempts < max_scroll_attempts:
-            # Get current conversations
-            elements = driver.find_elements(By.XPATH, selector)
-            current_count = len(elements)
+            # Read every (href, title) pair in one round-trip
+            try:
+                links = driver.execute_script(_COLLECT_LINKS_SCRIPT, selector, by) or []
+            except Exception as e:
+                logger.warning("Failed to read conversations: %s", e)
+                links = []
             
-            logger.info(f"📊 Current conversations found: {current_count}")
+            logger.info("📊 Current conversations found: %d", len(links))
             
-            # Extract new conversations
+            # Keep only conversations not seen on earlier scrolls
             new_conversations = 0
-            for i, element in enumerate(elements):
-                try:
-                    # Get the parent link element if we're on a span
-                    if element.tag_name == "span":
-                        parent = element.find_element(By.XPATH, "./..")
-                        href = parent.get_attribute("href")
-                    else:
-                        href = element.get_attribute("href")
-                    
-                    title = element.text.strip()
-                    
-                    if href and title and "/c/" in href and href not in seen_urls:
-                        conversation = {
-                            "id": href.split("/c/")[-1] if "/c/" in href else f"conv_{i}",
-                            "title": title,
-                            "url": href
-                        }
-                        conversations.append(conversation)
-                        seen_urls.add(href)
-                        new_conversations += 1
-                        
-                except Exception as e:
-                    logger.warning(f"Failed to extract conversation {i}: {e}")
+            for href, title in links:
+                if href in seen_urls:
+                    continue
+                match = search(href)
+                if not match or not title:
                     continue
+                append({"id": match.group(1), "title": title, "url": href})
+                add(href)
+                new_conversations += 1
             
-            logger.info(f"✅ Found {new_conversations} new conversations (Total: {len(conversations)})")
+            logger.info("✅ Found %d new conversations (Total: %d)", new_conversations, len(conversations))
             
             # Check if we're still finding new conversations
             if new_conversations == 0:
@@ -217,22 +337,29 @@ class AdaptiveExtractor:
             
             # Scroll down to load more conversations
             try:
+                previous_count = driver.execute_script(_COUNT_MATCHES_SCRIPT, selector, by)
+                
                 # Scroll to the bottom of the conversation list
                 driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-                time.sleep(2)  # Wait for new content to load
                 
                 # Alternative: scroll the conversation container specifically
-                conversation_containers = driver.find_elements(By.XPATH, "//nav | //div[contains(@class, 'conversation')] | //div[contains(@class, 'sidebar')]")
-                for container in conversation_containers:
-                    try:
-                        driver.execute_script("arguments[0].scrollTop = arguments[0].scrollHeight", container)
-                    except:
-                        continue
+                try:
+                    driver.execute_script(_SCROLL_CONTAINERS_SCRIPT, containers)
+                except StaleElementReferenceException:
+                    # The sidebar was re-rendered; look the containers up again
+                    containers = driver.find_elements(By.CSS_SELECTOR, _SCROLL_CONTAINERS)
+                    driver.execute_script(_SCROLL_CONTAINERS_SCRIPT, containers)
                 
-                time.sleep(1)  # Additional wait for content to load
+                # Wait until new content has loaded rather than for a fixed time
+                try:
+                    WebDriverWait(driver, _SCROLL_WAIT_SECONDS, poll_frequency=0.2).until(
+                        lambda d: d.execute_script(_COUNT_MATCHES_SCRIPT, selector, by) > previous_count
+                    )
+                except TimeoutException:
+                    logger.debug("No new content loaded after scrolling")
                 
             except Exception as e:
-                logger.warning(f"Scroll attempt {scroll_attempts + 1} failed: {e}")
+                logger.warning("Scroll attempt %d failed: %s", scroll_attempts + 1, e)
             
             scroll_attempts += 1
             
@@ -263,55 +390,14 @@ class AdaptiveExtractor:
             
             # Discover working URL
             working_url = self._discover_working_url(driver)
-            driver.get(working_url)
-            time.sleep(5)
-            
-            # Try cached selectors first
-            selectors_to_try = []
-            
-            # Add cached successful selectors first
-            if self.successful_selectors.get("selectors"):
-                selectors_to_try.extend(self.successful_selectors["selectors"])
-                logger.info(f"🔄 Trying {len(self.successful_selectors['selectors'])} cached selectors first")
-            
-            # Add all library selectors
-            selectors_to_try.extend(self.selector_library["conversation_links"])
             
-            # Remove duplicates while preserving order
-            seen = set()
-            selectors_to_try = [s for s in selectors_to_try if not (s in seen or seen.add(s))]
-            
-            logger.info(f"🔍 Testing {len(selectors_to_try)} selectors...")
+            conversations = self._try_cached_selectors(driver, working_url)
+            if conversations:
+                return conversations
             
-            for i, selector in enumerate(selectors_to_try):
-                try:
-                    logger.debug(f"Testing selector {i+1}/{len(selectors_to_try)}: {selector}")
-                    
-                    success, elements = self._test_selector(driver, selector)
-                    
-                    if success and elements:
-                        logger.info(f"✅ Found {len(elements)} conversations using selector: {selector}")
-                        
-                        # Extract conversations with infinite scrolling
-                        conversations = self._extract_conversations_with_scrolling(driver, selector)
-                        
-                        if conversations:
-                            # Cache successful selector
-                            if selector not in self.successful_selectors.get("selectors", []):
-                                if "selectors" not in self.successful_selectors:
-                                    self.successful_selectors["selectors"] = []
-                                self.successful_selectors["selectors"].insert(0, selector)  # Add to front
-                                self.successful_selectors["urls"] = [working_url]
-                                self._save_selector_cache()
-                            
-                            logger.info(f"✅ Extracted {len(conversations)} conversations")
-                            return conversations
-                        else:
-                            logger.warning(f"Selector found elements but no valid conversations: {selector}")
-                    
-                except Exception as e:
-                    logger.debug(f"Selector failed: {selector} - {e}")
-                    continue
+            conversations = self._probe_library(driver, working_url)
+            if conversations:
+                return conversations
             
             # If no selectors worked, try fallback approach
             logger.warning("❌ No selectors worked, trying fallback approach...")
@@ -321,11 +407,104 @@ class AdaptiveExtractor:
             logger.error(f"Failed to get conversation list: {e}")
             return []
     
+    def _try_cached_selectors(self, driver, working_url: str) -> List[Dict[str, str]]:
+        """Extract conversations with a cached selector, skipping the library probe."""
+        cached = self.successful_selectors.get("selectors") or []
+        if not cached:
+            return []
+        
+        logger.info(f"🔄 Trying {len(cached)} cached selectors first")
+        try:
+            WebDriverWait(driver, _PAGE_WAIT_SECONDS).until(
+                EC.presence_of_element_located((_selector_by(cached[0]), cached[0]))
+            )
+        except TimeoutException:
+            logger.debug(f"Cached selector not present: {cached[0]}")
+        
+        for selector in cached:
+            conversations = self._extract_with_selector(driver, selector, working_url)
+            if conversations:
+                return conversations
+        return []
+    
+    def _probe_library(self, driver, working_url: str) -> List[Dict[str, str]]:
+        """Probe the selector library for one that finds conversations."""
+        # Give the sidebar a moment to render before probing
+        try:
+            WebDriverWait(driver, _PAGE_WAIT_SECONDS).until(
+                EC.presence_of_element_located((By.CSS_SELECTOR, 'a[href*="/c/"]'))
+            )
+        except TimeoutException:
+            logger.debug("No conversation links present before probing")
+        
+        tried = set(self.successful_selectors.get("selectors") or [])
+        selectors_to_try = [s for s in self._probe_order if s not in tried]
+        logger.info(f"🔍 Testing {len(selectors_to_try)} selectors...")
+        
+        # Count every selector's matches in one round-trip and only extract
+        # with those that found conversations
+        try:
+            counts = driver.execute_script(
+                _PREFLIGHT_SCRIPT, [[selector, _selector_by(selector)] for selector in selectors_to_try]
+            )
+            selectors_to_try = [selector for selector, count in zip(selectors_to_try, counts) if count > 0]
+            logger.info(f"✅ {len(selectors_to_try)} selectors matched conversations")
+        except Exception as e:
+            logger.debug(f"Selector preflight failed, probing one by one: {e}")
+        
+        for i, selector in enumerate(selectors_to_try):
+            logger.debug(f"Testing selector {i+1}/{len(selectors_to_try)}: {selector}")
+            conversations = self._extract_with_selector(driver, selector, working_url)
+            if conversations:
+                return conversations
+        return []
+    
+    def _extract_with_selector(self, driver, selector: str, working_url: str) -> List[Dict[str, str]]:
+        """Extract all conversations with a selector and remember it if it works."""
+        try:
+            by = _selector_by(selector)
+            success, elements = self._test_selector(driver, selector, by)
+            if not (success and elements):
+                return []
+            
+            logger.info(f"✅ Found {len(elements)} conversations using selector: {selector}")
+            
+            # Extract conversations with infinite scrolling
+            conversations = self._extract_conversations_with_scrolling(driver, selector, by)
+            if not conversations:
+                logger.warning(f"Selector found elements but no valid conversations: {selector}")
+                return []
+            
+            self._remember_selector(selector, working_url)
+            logger.info(f"✅ Extracted {len(conversations)} conversations")
+            return conversations
+            
+        except Exception as e:
+            logger.debug(f"Selector failed: {selector} - {e}")
+            return []
+    
+    def _remember_selector(self, selector: str, working_url: str):
+        """Cache a working selector and URL, saving only when they change."""
+        selectors = self.successful_selectors.setdefault("selectors", [])
+        if selectors[:1] == [selector] and self.successful_selectors.get("urls") == [working_url]:
+            return
+        if selector in selectors:
+            selectors.remove(selector)
+        selectors.insert(0, selector)  # Add to front
+        self.successful_selectors["urls"] = [working_url]
+        self._save_selector_cache()
+    
     def _fallback_extraction(self, driver) -> List[Dict[str, str]]:
         """Fallback extraction method when all selectors fail."""
         try:
             logger.info("🔄 Attempting fallback extraction...")
             
+            # Parse the page once locally before asking the driver per link
+            conversations = self._extract_from_page_source(driver)
+            if conversations:
+                logger.info(f"✅ Fallback found {len(conversations)} conversations")
+                return conversations
+            
             # Get all links and filter for conversation URLs
             all_links = driver.find_elements(By.TAG_NAME, "a")
             conversations = []
@@ -335,9 +514,10 @@ class AdaptiveExtractor:
                     href = link.get_attribute("href")
                     text = link.text.strip()
                     
-                    if href and text and "/c/" in href:
+                    match = ID_RE.search(href) if href else None
+                    if match and text:
                         conversation = {
-                            "id": href.split("/c/")[-1],
+                            "id": match.group(1),
                             "title": text,
                             "url": href
                         }
@@ -357,6 +537,31 @@ class AdaptiveExtractor:
             logger.error(f"Fallback extraction failed: {e}")
             return []
     
+    def _extract_from_page_source(self, driver) -> List[Dict[str, str]]:
+        """Extract conversation links from one page_source snapshot parsed with lxml."""
+        if not LXML_AVAILABLE:
+            return []
+        
+        try:
+            doc = lxml.html.fromstring(driver.page_source)
+            base_url = driver.current_url
+        except Exception as e:
+            logger.debug(f"Page source parse failed: {e}")
+            return []
+        
+        conversations = []
+        for link in doc.xpath("//a[contains(@href, '/c/') and normalize-space(string()) != '']"):
+            # Raw attributes may be relative, unlike the driver's href property
+            href = urljoin(base_url, link.get("href"))
+            match = ID_RE.search(href)
+            if match:
+                conversations.append({
+                    "id": match.group(1),
+                    "title": link.text_content().strip(),
+                    "url": href
+                })
+        return conversations
+    
     def get_health_status(self) -> Dict[str, any]:
         """Get health status of the adaptive extractor."""
         return {
@@ -5,7 +5,6 @@ Integrated scraper with cookies, manual login, rate limits, and model selection.
 """
 
 import os
-import json
 import time
 import logging
 import hashlib
@@ -13,6 +12,7 @@ from pathlib import Path
 from typing import List, Dict, Optional, Callable
 from datetime import datetime
 
+from ..utils import jsonio
 from .browser_manager import BrowserManager
 from .cookie_manager import CookieManager
 from .login_handler import LoginHandler
@@ -21,6 +21,7 @@ from .adaptive_extractor import AdaptiveExtractor
 
 logger = logging.getLogger(__name__)
 
+
 class ChatGPTScraper:
     """
     Integrated ChatGPT scraper with all essential features.
@@ -42,7 +43,7 @@ class ChatGPTScraper:
                  totp_secret: Optional[str] = None,
                  cookie_file: Optional[str] = None,
                  rate_limit_delay: float = 2.0,
-                 progress_file: str = "data/scraper_progress.json"):
+                 progress_file: str = "data/scraper_progress.jsonl"):
         """
         Initialize the ChatGPT scraper.
         
@@ -54,7 +55,7 @@ class ChatGPTScraper:
             totp_secret: TOTP secret for 2FA
             cookie_file: Path to cookie file
             rate_limit_delay: Delay between requests (seconds)
-            progress_file: Path to progress tracking file
+            progress_file: Path to the append-only progress log (JSON lines)
         """
         # Initialize components
         self.browser_manager = BrowserManager(headless=headless, use_undetected=use_undetected)
@@ -102,6 +103,7 @@ class ChatGPTScraper:
     
     def close_driver(self):
         """Close the web driver."""
+        self.adaptive_extractor.flush_selector_cache()
         if self.driver:
             self.browser_manager.close_driver()
             self.driver = None
@@ -302,17 +304,21 @@ class ChatGPTScraper:
             if limit:
                 conversations = conversations[:limit]
             
+            # Hash each conversation once for the skip check and the progress log
+            pending = [(conv, self._get_conversation_hash(conv)) for conv in conversations]
+            
             # Filter out already processed conversations
             if skip_processed:
-                original_count = len(conversations)
-                conversations = [conv for conv in conversations if not self._is_conversation_processed(conv)]
-                skipped_count = original_count - len(conversations)
+                original_count = len(pending)
+                pending = [(conv, conv_hash) for conv, conv_hash in pending
+                           if not self._is_conversation_processed(conv, conv_hash)]
+                skipped_count = original_count - len(pending)
                 if skipped_count > 0:
                     logger.info(f"⏭️ Skipping {skipped_count} already processed conversations")
             
-            logger.info(f"📋 Found {len(conversations)} conversations to extract")
+            logger.info(f"📋 Found {len(pending)} conversations to extract")
             
-            if len(conversations) == 0:
+            if len(pending) == 0:
                 logger.info("✅ All conversations already processed!")
                 return {
                     "total": 0,
@@ -323,31 +329,31 @@ class ChatGPTScraper:
                 }
             
             stats = {
-                "total": len(conversations),
+                "total": len(pending),
                 "extracted": 0,
                 "failed": 0,
                 "skipped": progress_stats["total_processed"],
                 "errors": []
             }
             
-            for i, conversation in enumerate(conversations):
+            for i, (conversation, conv_hash) in enumerate(pending):
                 try:
-                    logger.info(f"📝 Extracting conversation {i+1}/{len(conversations)}: {conversation.get('title', 'Unknown')}")
+                    logger.info(f"📝 Extracting conversation {i+1}/{len(pending)}: {conversation.get('title', 'Unknown')}")
                     
                     if self.extract_conversation(conversation['url'], output_dir):
                         stats["extracted"] += 1
-                        self._mark_conversation_processed(conversation, success=True)
+                        self._mark_conversation_processed(conversation, success=True, conv_hash=conv_hash)
                     else:
                         stats["failed"] += 1
-                        self._mark_conversation_processed(conversation, success=False)
+                        self._mark_conversation_processed(conversation, success=False, conv_hash=conv_hash)
                         stats["errors"].append(f"Failed to extract {conversation.get('id', 'unknown')}")
                     
                     if progress_callback:
-                        progress_callback(i + 1, len(conversations))
+                        progress_callback(i + 1, len(pending))
                         
                 except Exception as e:
                     stats["failed"] += 1
-                    self._mark_conversation_processed(conversation, success=False)
+                    self._mark_conversation_processed(conversation, success=False, conv_hash=conv_hash)
                     stats["errors"].append(f"Error extracting {conversation.get('id', 'unknown')}: {e}")
                     logger.error(f"Error extracting conversation: {e}")
             
@@ -371,23 +377,82 @@ class ChatGPTScraper:
         return self.adaptive_extractor.get_health_status() 
 
     def _load_progress(self) -> Dict[str, Dict]:
-        """Load progress from file."""
+        """Load progress from file.
+        
+        The file is a JSON lines log with one entry per processed
+        conversation; later entries for the same conversation win. Files in
+        the old single-dict format, including a scraper_progress.json left
+        next to a missing .jsonl log, are loaded and rewritten as a log. A
+        migrated scraper_progress.json is renamed to .json.migrated so it is
+        not imported again.
+        """
         try:
-            if os.path.exists(self.progress_file):
-                with open(self.progress_file, 'r') as f:
-                    progress = json.load(f)
-                    logger.info(f"📊 Loaded progress: {len(progress)} conversations already processed")
-                    return progress
+            source = self.progress_file
+            if not os.path.exists(source):
+                legacy_file = self._legacy_progress_file()
+                if legacy_file and os.path.exists(legacy_file):
+                    logger.info(f"📊 Migrating progress from {legacy_file}")
+                    source = legacy_file
+            
+            if os.path.exists(source):
+                with open(source, 'rb') as f:
+                    data = f.read()
+                
+                try:
+                    legacy = jsonio.loads(data)
+                except ValueError:
+                    legacy = None
+                
+                if isinstance(legacy, dict) and "hash" not in legacy:
+                    progress = legacy
+                    self._save_progress(progress)
+                else:
+                    progress = {}
+                    for line in data.splitlines():
+                        if not line.strip():
+                            continue
+                        try:
+                            entry = jsonio.loads(line)
+                            progress[entry.pop("hash")] = entry
+                        except (ValueError, KeyError, AttributeError, TypeError):
+                            logger.warning("Skipping unreadable progress entry")
+                    
+                    # A write cut short leaves a partial last line; rewrite so
+                    # the next append starts on a fresh line
+                    if source != self.progress_file or (data and not data.endswith(b"\n")):
+                        self._save_progress(progress)
+                
+                if source != self.progress_file and os.path.exists(self.progress_file):
+                    os.replace(source, source + ".migrated")
+                
+                logger.info(f"📊 Loaded progress: {len(progress)} conversations already processed")
+                return progress
         except Exception as e:
             logger.warning(f"Failed to load progress: {e}")
         return {}
     
-    def _save_progress(self):
-        """Save progress to file."""
+    def _legacy_progress_file(self) -> Optional[str]:
+        """Path of the old single-dict progress file next to a .jsonl log."""
+        if self.progress_file.endswith(".jsonl"):
+            return os.path.splitext(self.progress_file)[0] + ".json"
+        return None
+    
+    def _save_progress(self, progress: Dict[str, Dict]):
+        """Rewrite the progress log with one entry per conversation."""
+        try:
+            os.makedirs(os.path.dirname(self.progress_file) or ".", exist_ok=True)
+            with open(self.progress_file, 'wb') as f:
+                f.write(b"".join(jsonio.dumps({"hash": conv_hash, **entry}) + b"\n"
+                                 for conv_hash, entry in progress.items()))
+        except Exception as e:
+            logger.error(f"Failed to save progress: {e}")
+    
+    def _append_progress(self, conv_hash: str, entry: Dict):
+        """Append one conversation's entry to the progress log."""
         try:
-            os.makedirs(os.path.dirname(self.progress_file), exist_ok=True)
-            with open(self.progress_file, 'w') as f:
-                json.dump(self.processed_conversations, f, indent=2)
+            os.makedirs(os.path.dirname(self.progress_file) or ".", exist_ok=True)
+            with open(self.progress_file, 'ab') as f:
+                f.write(jsonio.dumps({"hash": conv_hash, **entry}) + b"\n")
         except Exception as e:
             logger.error(f"Failed to save progress: {e}")
     
@@ -396,28 +461,45 @@ class ChatGPTScraper:
         content = f"{conversation.get('id', '')}{conversation.get('title', '')}{conversation.get('url', '')}"
         return hashlib.md5(content.encode()).hexdigest()
     
-    def _is_conversation_processed(self, conversation: Dict) -> bool:
-        """Check if conversation has already been processed."""
-        conv_hash = self._get_conversation_hash(conversation)
-        return conv_hash in self.processed_conversations
+    def _is_conversation_processed(self, conversation: Dict, conv_hash: Optional[str] = None) -> bool:
+        """Check if conversation has already been processed.
+        
+        Args:
+            conversation: Conversation to check
+            conv_hash: Precomputed hash of the conversation, if already known
+        """
+        if conv_hash is None:
+            conv_hash = self._get_conversation_hash(conversation)
+        return self.processed_conversations.get(conv_hash) is not None
     
-    def _mark_conversation_processed(self, conversation: Dict, success: bool = True):
-        """Mark conversation as processed."""
-        conv_hash = self._get_conversation_hash(conversation)
-        self.processed_conversations[conv_hash] = {
+    def _mark_conversation_processed(self, conversation: Dict, success: bool = True,
+                                     conv_hash: Optional[str] = None):
+        """Mark conversation as processed.
+        
+        Args:
+            conversation: Conversation to mark
+            success: Whether extraction succeeded
+            conv_hash: Precomputed hash of the conversation, if already known
+        """
+        if conv_hash is None:
+            conv_hash = self._get_conversation_hash(conversation)
+        entry = {
             "id": conversation.get('id'),
             "title": conversation.get('title'),
             "url": conversation.get('url'),
             "processed_at": datetime.now().isoformat(),
             "success": success
         }
-        self._save_progress()
+        self.processed_conversations[conv_hash] = entry
+        self._append_progress(conv_hash, entry)
     
     def reset_progress(self):
         """Reset progress tracking."""
         self.processed_conversations = {}
-        if os.path.exists(self.progress_file):
-            os.remove(self.progress_file)
+        legacy_file = self._legacy_progress_file()
+        for path in (self.progress_file, legacy_file):
+            if path and os.path.exists(path):
+                os.remove(path)
         logger.info("🔄 Progress reset - will process all conversations")
     
     def get_progress_stats(self) -> Dict[str, any]:
@@ -4,14 +4,33 @@ Cookie Manager for DreamVault ChatGPT Scraper
 Handles cookie persistence and session management for ChatGPT login.
 """
 
-import json
 import logging
 from pathlib import Path
 from typing import Dict, List, Optional
 from selenium.webdriver.remote.webdriver import WebDriver
 
+from ..utils import jsonio
+
 logger = logging.getLogger(__name__)
 
+
+# Selenium cookie fields that CDP's CookieParam accepts under the same name
+_CDP_COOKIE_FIELDS = ("name", "value", "domain", "path", "secure", "httpOnly")
+_CDP_SAME_SITE = ("Strict", "Lax", "None")
+
+
+def _to_cdp_cookie(cookie: Dict, url: str) -> Dict:
+    """Convert a Selenium cookie dict into a CDP CookieParam."""
+    param = {key: cookie[key] for key in _CDP_COOKIE_FIELDS if key in cookie}
+    if "expiry" in cookie:
+        param["expires"] = cookie["expiry"]
+    if cookie.get("sameSite") in _CDP_SAME_SITE:
+        param["sameSite"] = cookie["sameSite"]
+    if "domain" not in param:
+        param["url"] = url
+    return param
+
+
 class CookieManager:
     """Manages cookie persistence and session management."""
     
@@ -25,6 +44,9 @@ class CookieManager:
         self.cookie_file = cookie_file or "data/cookies.json"
         self.cookie_path = Path(self.cookie_file)
         self.cookie_path.parent.mkdir(parents=True, exist_ok=True)
+        
+        # (mtime_ns, size) of the cookie file last checked and its validity
+        self._validity_cache = (None, False)
     
     def save_cookies(self, driver: WebDriver) -> bool:
         """
@@ -39,8 +61,8 @@ class CookieManager:
         try:
             cookies = driver.get_cookies()
             
-            with open(self.cookie_path, 'w', encoding='utf-8') as f:
-                json.dump(cookies, f, indent=2)
+            # Machine-read only, so no pretty-printing
+            self.cookie_path.write_bytes(jsonio.dumps(cookies))
             
             logger.info(f"✅ Saved {len(cookies)} cookies to {self.cookie_file}")
             return True
@@ -64,15 +86,15 @@ class CookieManager:
                 logger.warning(f"Cookie file not found: {self.cookie_file}")
                 return False
             
-            with open(self.cookie_path, 'r', encoding='utf-8') as f:
-                cookies = json.load(f)
+            cookies = jsonio.loads(self.cookie_path.read_bytes())
             
-            # Add cookies to driver
-            for cookie in cookies:
-                try:
-                    driver.add_cookie(cookie)
-                except Exception as e:
-                    logger.warning(f"Failed to add cookie: {e}")
+            # Install all cookies in one CDP call on Chromium drivers
+            if not self._set_cookies_cdp(driver, cookies):
+                for cookie in cookies:
+                    try:
+                        driver.add_cookie(cookie)
+                    except Exception as e:
+                        logger.warning(f"Failed to add cookie: {e}")
             
             logger.info(f"✅ Loaded {len(cookies)} cookies from {self.cookie_file}")
             return True
@@ -81,6 +103,29 @@ class CookieManager:
             logger.error(f"Failed to load cookies: {e}")
             return False
     
+    def _set_cookies_cdp(self, driver: WebDriver, cookies: List[Dict]) -> bool:
+        """
+        Install cookies with a single Network.setCookies call.
+        
+        Args:
+            driver: Selenium webdriver instance
+            cookies: Cookies in Selenium's format
+            
+        Returns:
+            True if the cookies were set, False if CDP is unavailable or failed
+        """
+        if not hasattr(driver, "execute_cdp_cmd"):
+            return False
+        
+        try:
+            driver.execute_cdp_cmd("Network.setCookies", {
+                "cookies": [_to_cdp_cookie(cookie, driver.current_url) for cookie in cookies]
+            })
+            return True
+        except Exception as e:
+            logger.warning(f"Failed to set cookies over CDP: {e}")
+            return False
+    
     def has_valid_cookies(self) -> bool:
         """
         Check if valid cookies exist.
@@ -88,15 +133,22 @@ class CookieManager:
         Returns:
             True if cookie file exists and is not empty
         """
-        if not self.cookie_path.exists():
+        try:
+            stat = self.cookie_path.stat()
+        except OSError:
             return False
         
+        # An unchanged file gives the same answer without re-parsing it
+        key = (stat.st_mtime_ns, stat.st_size)
+        if key == self._validity_cache[0]:
+            return self._validity_cache[1]
+        
         try:
-            with open(self.cookie_path, 'r', encoding='utf-8') as f:
-                cookies = json.load(f)
-            return len(cookies) > 0
+            valid = len(jsonio.loads(self.cookie_path.read_bytes())) > 0
         except Exception:
-            return False
+            valid = False
+        self._validity_cache = (key, valid)
+        return valid
     
     def clear_cookies(self) -> bool:
         """
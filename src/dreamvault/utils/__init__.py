@@ -0,0 +1,9 @@
+"""
+DreamVault Utilities
+
+Small helpers shared across the DreamVault packages.
+"""
+
+from . import jsonio
+
+__all__ = ["jsonio"]
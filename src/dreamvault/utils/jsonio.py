@@ -0,0 +1,51 @@
+"""
+JSON encoding helpers for DreamVault.
+
+Uses orjson when it is installed and falls back to the standard library
+json module otherwise. Both paths take and return UTF-8 bytes.
+"""
+
+import json
+from typing import Any, Callable, Optional
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+    orjson = None
+
+
+def dumps(data: Any, default: Optional[Callable[[Any], Any]] = None, indent: bool = False) -> bytes:
+    """
+    Encode data as UTF-8 JSON bytes.
+    
+    Args:
+        data: Value to encode
+        default: Called for objects the encoder cannot serialize natively;
+            must return a serializable value or raise TypeError
+        indent: Indent with two spaces instead of writing compact JSON
+        
+    Returns:
+        Encoded JSON
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data, default=default, option=orjson.OPT_INDENT_2 if indent else None)
+    if indent:
+        return json.dumps(data, indent=2, ensure_ascii=False, default=default).encode('utf-8')
+    return json.dumps(data, separators=(',', ':'), ensure_ascii=False, default=default).encode('utf-8')
+
+
+def loads(data) -> Any:
+    """
+    Decode JSON from bytes, str, or (with orjson) a memoryview.
+    
+    Args:
+        data: Encoded JSON
+        
+    Returns:
+        Decoded value
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
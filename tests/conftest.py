@@ -0,0 +1,52 @@
+"""
+Shared pytest fixtures for DreamVault tests.
+"""
+
+import shutil
+from pathlib import Path
+
+import pytest
+
+@pytest.fixture(scope="session")
+def scraper():
+    """One headless ChatGPT scraper shared by every browser test in the session.
+
+    Starting Chrome dominates short browser tests, so the driver is started
+    once and closed after the last test that uses it.
+    """
+    pytest.importorskip("selenium")
+    from dreamvault.scrapers import ChatGPTScraper
+
+    scraper = ChatGPTScraper(headless=True)
+    with scraper:
+        if scraper.driver is None:
+            pytest.skip("Browser could not be started")
+        yield scraper
+
+
+@pytest.fixture(scope="session")
+def models_dir(tmp_path_factory):
+    """Private copy of the repository's models/ for this session or xdist worker."""
+    source = Path(__file__).parent.parent / "models"
+    if not source.is_dir():
+        pytest.skip("models dir missing")
+
+    target = tmp_path_factory.mktemp("models")
+    shutil.copytree(source, target, dirs_exist_ok=True)
+    return target
+
+
+@pytest.fixture(scope="session")
+def model_manager(models_dir):
+    """One ModelManager over models_dir shared by the deployment tests."""
+    ModelManager = pytest.importorskip("dreamvault.deployment").ModelManager
+
+    manager = ModelManager(str(models_dir))
+    yield manager
+    manager.cleanup()
+
+
+@pytest.fixture(scope="session")
+def discovered_models(model_manager):
+    """Models found in models_dir, discovered once per session."""
+    return model_manager.discover_models()
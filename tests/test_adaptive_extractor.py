@@ -0,0 +1,41 @@
+#!/usr/bin/env python3
+"""
+Test DreamVault Adaptive Extractor helpers
+
+Tests the extractor's pure helpers without a browser; see
+test_adaptive_system.py for the live browser checks.
+"""
+
+import pytest
+
+pytest.importorskip("selenium")
+
+from dreamvault.scrapers.adaptive_extractor import ID_RE
+
+
+@pytest.mark.parametrize("url, conversation_id", [
+    ("https://chat.openai.com/c/abc123", "abc123"),
+    ("https://chatgpt.com/c/6650f1a2-08bc-8000-9c3e-1f2a3b4c5d6e", "6650f1a2-08bc-8000-9c3e-1f2a3b4c5d6e"),
+    ("/c/abc123?model=gpt-4", "abc123"),
+    ("https://chatgpt.com/g/g-xyz/c/abc-123/", "abc-123"),
+])
+def test_id_re_extracts_conversation_ids(url, conversation_id):
+    """Test that conversation URLs yield their id."""
+    match = ID_RE.search(url)
+    assert match and match.group(1) == conversation_id
+
+
+@pytest.mark.parametrize("url", [
+    "https://chatgpt.com/",
+    "https://chatgpt.com/gpts",
+    "https://chatgpt.com/abc/def",
+    "https://chatgpt.com/c/",
+])
+def test_id_re_rejects_other_links(url):
+    """Test that links other than conversations do not match."""
+    assert ID_RE.search(url) is None
+
+
+if __name__ == "__main__":
+    import sys
+    sys.exit(pytest.main([__file__]))
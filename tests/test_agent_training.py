@@ -6,12 +6,8 @@ Creates sample training data and tests the agent training pipeline.
 """
 
 import json
-import sys
 from pathlib import Path
 
-# Add src to path for imports
-sys.path.insert(0, str(Path(__file__).parent / "src"))
-
 from dreamvault.agents import (
     ConversationAgentTrainer,
     SummarizationAgentTrainer,
@@ -20,9 +16,8 @@ from dreamvault.agents import (
     EmbeddingAgentTrainer
 )
 
-def create_sample_training_data():
+def create_sample_training_data(training_dir: Path):
     """Create sample training data for testing."""
-    training_dir = Path("data/training")
     training_dir.mkdir(parents=True, exist_ok=True)
     
     # Sample conversation pairs
@@ -110,11 +105,14 @@ def create_sample_training_data():
     
     print("✅ Created sample training data")
 
-def test_agent_trainers():
+def test_agent_trainers(tmp_path):
     """Test all agent trainers with sample data."""
     print("🧪 Testing Agent Trainers")
     print("=" * 30)
     
+    training_dir = tmp_path / "training"
+    create_sample_training_data(training_dir)
+    
     agents = [
         ("Conversation Agent", ConversationAgentTrainer),
         ("Summarization Agent", SummarizationAgentTrainer),
@@ -125,36 +123,14 @@ def test_agent_trainers():
     
     for name, trainer_class in agents:
         print(f"\n{name}:")
-        try:
-            trainer = trainer_class(training_data_dir="data/training")
-            pairs = trainer.load_training_data()
-            stats = trainer.get_training_stats()
-            
-            print(f"  ✅ Loaded {len(pairs)} training pairs")
-            print(f"  📊 Stats: {stats.get('total_pairs', 0)} pairs, {stats.get('training_files', 0)} files")
-            
-            # Test data preparation
-            if pairs:
-                training_data = trainer.prepare_training_data(pairs)
-                print(f"  📋 Prepared training data: {len(training_data['train'])} train, {len(training_data['validation'])} validation")
-            
-        except Exception as e:
-            print(f"  ❌ Error: {e}")
-
-def main():
-    """Main test function."""
-    print("🚀 DreamVault Agent Training Test")
-    print("=" * 40)
-    
-    # Create sample data
-    create_sample_training_data()
-    
-    # Test trainers
-    test_agent_trainers()
-    
-    print(f"\n✅ Agent training system test completed!")
-    print(f"📁 Sample data created in: data/training/")
-    print(f"🚀 Ready to train agents: python run_agent_training.py --stats")
-
-if __name__ == "__main__":
-    main() 
\ No newline at end of file
+        trainer = trainer_class(training_data_dir=str(training_dir))
+        pairs = trainer.load_training_data()
+        stats = trainer.get_training_stats()
+        
+        print(f"  ✅ Loaded {len(pairs)} training pairs")
+        print(f"  📊 Stats: {stats.get('total_pairs', 0)} pairs, {stats.get('training_files', 0)} files")
+        assert pairs, f"{name} loaded no training pairs"
+        
+        # Test data preparation
+        training_data = trainer.prepare_training_data(pairs)
+        print(f"  📋 Prepared training data: {len(training_data['train'])} train, {len(training_data['validation'])} validation")
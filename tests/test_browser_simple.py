@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+"""
+Simple Browser Test for DreamVault
+
+Tests basic browser functionality without login requirements.
+"""
+
+import logging
+import sys
+
+import pytest
+
+pytestmark = pytest.mark.network
+
+# Seconds to wait for a page to finish loading
+PAGE_LOAD_TIMEOUT = 15
+
+def setup_logging():
+    """Setup logging configuration."""
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+        handlers=[
+            logging.StreamHandler(sys.stdout)
+        ]
+    )
+
+def wait_for_page(driver):
+    """Wait until the current page has finished loading."""
+    from selenium.webdriver.support.ui import WebDriverWait
+    
+    WebDriverWait(driver, PAGE_LOAD_TIMEOUT).until(
+        lambda d: d.execute_script("return document.readyState") == "complete"
+    )
+
+def test_browser_simple(scraper):
+    """Test basic browser functionality."""
+    # Test basic navigation
+    scraper.driver.get("https://www.google.com")
+    wait_for_page(scraper.driver)
+    assert "google" in scraper.driver.current_url
+    assert scraper.driver.title
+    
+    # Test ChatGPT navigation
+    scraper.driver.get("https://chatgpt.com")
+    wait_for_page(scraper.driver)
+    assert "chatgpt.com" in scraper.driver.current_url
+
+if __name__ == "__main__":
+    setup_logging()
+    sys.exit(pytest.main([__file__, "-m", "network"]))
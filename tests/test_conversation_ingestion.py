@@ -10,14 +10,10 @@ import unittest
 import json
 import tempfile
 import shutil
-import sys
 from pathlib import Path
 from unittest.mock import Mock, patch, MagicMock
 import logging
 
-# Add src to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
-
 from dreamvault.core.integrated_ingester import IntegratedIngester
 
 
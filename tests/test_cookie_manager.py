@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+Test DreamVault Cookie Manager
+
+Tests cookie conversion and persistence without a browser.
+"""
+
+import json
+import os
+
+import pytest
+
+pytest.importorskip("selenium")
+
+from dreamvault.scrapers import cookie_manager
+from dreamvault.scrapers.cookie_manager import CookieManager, _to_cdp_cookie
+
+URL = "https://chat.openai.com/"
+
+
+def test_to_cdp_cookie_maps_selenium_fields():
+    """Test converting a full Selenium cookie into a CDP CookieParam."""
+    cookie = {
+        "name": "session",
+        "value": "abc",
+        "domain": ".openai.com",
+        "path": "/",
+        "secure": True,
+        "httpOnly": True,
+        "expiry": 1893456000,
+        "sameSite": "Lax",
+    }
+    assert _to_cdp_cookie(cookie, URL) == {
+        "name": "session",
+        "value": "abc",
+        "domain": ".openai.com",
+        "path": "/",
+        "secure": True,
+        "httpOnly": True,
+        "expires": 1893456000,
+        "sameSite": "Lax",
+    }
+
+
+def test_to_cdp_cookie_without_domain_uses_url():
+    """Test that session cookies without a domain are bound to the page URL."""
+    param = _to_cdp_cookie({"name": "n", "value": "v", "sameSite": "bogus"}, URL)
+    assert param == {"name": "n", "value": "v", "url": URL}
+
+
+
+def test_has_valid_cookies_tracks_file_rewrites(tmp_path, monkeypatch):
+    """Test that the validity cache is reused until the cookie file changes."""
+    cookie_file = tmp_path / "cookies.json"
+    manager = CookieManager(str(cookie_file))
+    assert not manager.has_valid_cookies()
+    
+    cookie_file.write_text(json.dumps([{"name": "session", "value": "abc"}]))
+    assert manager.has_valid_cookies()
+    
+    # An unchanged file is answered from the cache without re-parsing
+    parses = []
+    real_loads = cookie_manager.jsonio.loads
+    monkeypatch.setattr(cookie_manager.jsonio, "loads", lambda data: parses.append(data) or real_loads(data))
+    assert manager.has_valid_cookies()
+    assert not parses
+    
+    # Rewriting the file invalidates the cache, even at the same size
+    stat = cookie_file.stat()
+    cookie_file.write_text(json.dumps([{"name": "session", "value": "xyz"}]))
+    os.utime(cookie_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    assert manager.has_valid_cookies()
+    assert len(parses) == 1
+    
+    cookie_file.write_text("[]")
+    assert not manager.has_valid_cookies()
+    
+    cookie_file.unlink()
+    assert not manager.has_valid_cookies()
+
+
+if __name__ == "__main__":
+    import sys
+    sys.exit(pytest.main([__file__]))
@@ -4,15 +4,25 @@
 import sqlite3
 import json
 
+
+def connect(path):
+    """Open the database in WAL mode so readers do not block writers."""
+    conn = sqlite3.connect(path)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute("PRAGMA mmap_size=268435456")
+    return conn
+
+
 print("🛰️ Testing DreamVault Database...")
 
 # Connect to database
-conn = sqlite3.connect('data/conversations.db')
+conn = connect('data/conversations.db')
 cursor = conn.cursor()
 
-# Test basic queries
-cursor.execute("SELECT COUNT(*) FROM conversations")
-count = cursor.fetchone()[0]
+# Test basic queries; both counts come back in one round-trip
+cursor.execute("SELECT (SELECT COUNT(*) FROM conversations), (SELECT COUNT(*) FROM conversations_fts)")
+count, fts_count = cursor.fetchone()
 print(f"✅ Found {count} conversations in database")
 
 # Get a sample conversation
@@ -23,7 +33,7 @@ if row:
     print(f"📝 Summary: {row[1][:100]}...")
 
 # Get unique tags
-cursor.execute("SELECT tags FROM conversations WHERE tags != '[]' LIMIT 5")
+cursor.execute("SELECT tags FROM conversations WHERE tags != ? LIMIT ?", ('[]', 5))
 tags_data = cursor.fetchall()
 print(f"🏷️  Sample tags from conversations:")
 for row in tags_data:
@@ -34,9 +44,7 @@ for row in tags_data:
         print(f"  - {row[0]}")
 
 # Test full-text search
-cursor.execute("SELECT COUNT(*) FROM conversations_fts")
-fts_count = cursor.fetchone()[0]
 print(f"🔍 Full-text search index: {fts_count} entries")
 
 conn.close()
-print("✅ Database test completed!") 
\ No newline at end of file
+print("✅ Database test completed!")
@@ -6,155 +6,129 @@ Tests the deployment system components.
 """
 
 import json
-import sys
-from pathlib import Path
 
-# Add src to path for imports
-sys.path.insert(0, str(Path(__file__).parent / "src"))
+import pytest
 
-from dreamvault.deployment import (
-    ModelManager,
-    DeploymentConfig
-)
+_deployment = pytest.importorskip("dreamvault.deployment")
+ModelManager = _deployment.ModelManager
+DeploymentConfig = _deployment.DeploymentConfig
 
-def test_model_manager():
+from dreamvault.deployment.deployment_config import _parse_size
+
+def test_model_manager(model_manager, discovered_models):
     """Test model manager functionality."""
-    print("🧪 Testing Model Manager")
-    print("=" * 30)
+    # Models were discovered once for the session, in this worker's copy of models/
+    models = discovered_models
     
-    try:
-        # Initialize model manager
-        model_manager = ModelManager("models")
-        
-        # Discover models
-        models = model_manager.discover_models()
-        print(f"✅ Discovered {len(models)} models")
-        
-        # List models
-        model_info = model_manager.list_models()
-        print(f"✅ Model info: {model_info.get('total_available', 0)} available, {model_info.get('total_loaded', 0)} loaded")
-        
-        # Test model loading (if models exist)
-        if models:
-            model_name = list(models.keys())[0]
-            print(f"🔍 Testing model loading: {model_name}")
-            
-            success = model_manager.load_model(model_name)
-            if success:
-                print(f"✅ Model {model_name} loaded successfully")
-                
-                # Get model stats
-                stats = model_manager.get_model_stats(model_name)
-                print(f"✅ Model stats: {stats}")
-                
-                # Unload model
-                model_manager.unload_model(model_name)
-                print(f"✅ Model {model_name} unloaded")
-            else:
-                print(f"❌ Failed to load model {model_name}")
-        else:
-            print("ℹ️  No models found for testing")
-        
-        # Cleanup
-        model_manager.cleanup()
-        print("✅ Model manager cleanup completed")
+    # List models
+    model_info = model_manager.list_models()
+    assert model_info.get('total_available', 0) == len(models)
+    
+    # Test model loading (if models exist)
+    if not models:
+        pytest.skip("No models found for testing")
+    
+    model_name = next(iter(models))
+    if model_manager.load_model(model_name):
+        # Get model stats
+        assert model_manager.get_model_stats(model_name)
         
-    except Exception as e:
-        print(f"❌ Model manager test error: {e}")
+        # Unload model
+        model_manager.unload_model(model_name)
 
-def test_deployment_config():
+def test_deployment_config(tmp_path):
     """Test deployment configuration."""
-    print("\n🧪 Testing Deployment Configuration")
-    print("=" * 40)
+    # Initialize config
+    config = DeploymentConfig(str(tmp_path / "deployment_config.json"))
     
-    try:
-        # Initialize config
-        config = DeploymentConfig("test_deployment_config.json")
-        
-        # Test configuration methods
-        print("✅ Configuration initialized")
-        
-        # Test get/set
-        config.set("test.value", "test_data")
-        value = config.get("test.value")
-        print(f"✅ Get/Set test: {value}")
-        
-        # Test configuration sections
-        api_config = config.get_api_config()
-        web_config = config.get_web_config()
-        model_config = config.get_model_config()
-        
-        print(f"✅ API config: {api_config.get('host')}:{api_config.get('port')}")
-        print(f"✅ Web config: {web_config.get('host')}:{web_config.get('port')}")
-        print(f"✅ Model config: {model_config.get('models_dir')}")
-        
-        # Test validation
-        is_valid = config.validate_config()
-        print(f"✅ Configuration validation: {is_valid}")
-        
-        # Test summary
-        summary = config.get_summary()
-        print(f"✅ Configuration summary: {len(summary)} sections")
-        
-        # Cleanup
-        import os
-        if os.path.exists("test_deployment_config.json"):
-            os.remove("test_deployment_config.json")
-        print("✅ Test configuration file cleaned up")
-        
-    except Exception as e:
-        print(f"❌ Deployment config test error: {e}")
-
-def test_deployment_integration():
-    """Test deployment system integration."""
-    print("\n🧪 Testing Deployment Integration")
-    print("=" * 40)
+    # Test get/set
+    config.set("test.value", "test_data")
+    assert config.get("test.value") == "test_data"
     
-    try:
-        # Test configuration
-        config = DeploymentConfig("test_integration_config.json")
-        
-        # Test model manager with config
-        model_config = config.get_model_config()
-        model_manager = ModelManager(model_config.get('models_dir', 'models'))
-        
-        # Test model discovery
-        models = model_manager.discover_models()
-        print(f"✅ Integration test: {len(models)} models discovered")
-        
-        # Test configuration with model manager
-        api_config = config.get_api_config()
-        web_config = config.get_web_config()
-        
-        print(f"✅ Integration test: API {api_config.get('host')}:{api_config.get('port')}")
-        print(f"✅ Integration test: Web {web_config.get('host')}:{web_config.get('port')}")
-        
-        # Cleanup
-        model_manager.cleanup()
-        import os
-        if os.path.exists("test_integration_config.json"):
-            os.remove("test_integration_config.json")
-        print("✅ Integration test cleanup completed")
-        
-    except Exception as e:
-        print(f"❌ Integration test error: {e}")
-
-def main():
-    """Main test function."""
-    print("🚀 DreamVault Deployment System Test")
-    print("=" * 50)
+    # Test batched updates
+    with config.batch():
+        config.set("test.first", 1)
+        config.set("test.second", 2)
+    assert (config.get("test.first"), config.get("test.second")) == (1, 2)
+    
+    # Test configuration sections
+    api_config = config.get_api_config()
+    web_config = config.get_web_config()
+    model_config = config.get_model_config()
+    
+    assert api_config.get('host') and api_config.get('port')
+    assert web_config.get('host') and web_config.get('port')
+    assert model_config.get('models_dir')
+    
+    # Test validation
+    assert config.validate_config()
+    
+    # Test that changes after a reset leave the defaults untouched
+    default_port = config.default_config['api_server']['port']
+    config.reset_to_defaults()
+    config.set("api_server.port", default_port + 1)
+    assert config.default_config['api_server']['port'] == default_port
     
-    # Test model manager
-    test_model_manager()
+    # Test summary
+    summary = config.get_summary()
+    assert summary
+    assert config.get_summary() is summary
+    with pytest.raises(TypeError):
+        summary['api_server']['port'] = None
+    with pytest.raises(AttributeError):
+        summary['security']['allowed_origins'].append("https://example.invalid")
+    assert summary['api_server']['port'] == config.get('api_server.port')
     
-    # Test deployment configuration
-    test_deployment_config()
+    # Test that updates invalidate the cached summary
+    config.set("api_server.port", default_port + 2)
+    assert config.get_summary()['api_server']['port'] == default_port + 2
+
+@pytest.mark.parametrize("size, expected", [
+    ("10MB", 10 * 1024 * 1024),
+    ("512k", 512 * 1024),
+    (2048, 2048),
+    ("1.5 KB", 1536),
+])
+def test_parse_size(size, expected):
+    """Test parsing human-readable sizes into bytes."""
+    assert _parse_size(size) == expected
+
+
+def test_parse_size_rejects_garbage():
+    """Test that unparseable sizes raise ValueError."""
+    with pytest.raises(ValueError):
+        _parse_size("garbage")
+
+
+def test_invalid_sizes_fall_back_to_defaults(tmp_path):
+    """Test that bad size settings fall back per key without dropping the config."""
+    config_file = tmp_path / "sizes_config.json"
+    config_file.write_text(json.dumps({
+        "api_server": {"port": 9123},
+        "security": None,
+        "logging": {"max_file_size": "garbage"},
+    }))
+    config = DeploymentConfig(str(config_file))
     
-    # Test integration
-    test_deployment_integration()
+    assert config.get('api_server.port') == 9123
+    assert config.get_max_request_size_bytes() == _parse_size(config.default_config['security']['max_request_size'])
+    assert config.get_max_log_file_size_bytes() == _parse_size(config.default_config['logging']['max_file_size'])
     
-    print(f"\n✅ All deployment system tests completed!")
-    print(f"🚀 Ready to deploy: python run_deployment.py --show-config")
+    config.set('logging.max_file_size', "2MB")
+    assert config.get_max_log_file_size_bytes() == 2 * 1024 * 1024
 
-if __name__ == "__main__":
-    main() 
\ No newline at end of file
+
+def test_deployment_integration(tmp_path, model_manager, discovered_models):
+    """Test deployment system integration."""
+    # Test configuration
+    config = DeploymentConfig(str(tmp_path / "integration_config.json"))
+    
+    # Test model manager with config
+    model_config = config.get_model_config()
+    assert model_config.get('models_dir')
+    assert model_manager.list_models()['total_available'] == len(discovered_models)
+    
+    # Test configuration with model manager
+    api_config = config.get_api_config()
+    web_config = config.get_web_config()
+    assert api_config.get('port') != web_config.get('port')
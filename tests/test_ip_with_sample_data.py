@@ -7,48 +7,54 @@ actual IP patterns like product ideas, abandoned concepts, etc.
 """
 
 import json
-import sys
-from pathlib import Path
+from types import MappingProxyType
 
-# Add src to path for imports
-sys.path.insert(0, str(Path(__file__).parent / "src"))
+import pytest
 
 from dreamvault.resurrection.ip_extractor import IPExtractor
 
 
-def create_sample_conversation():
-    """Create a sample conversation with IP patterns."""
-    return {
-        "conversation_id": "sample_conv_001",
-        "summary": "Discussed building a new AI-powered task management app that could revolutionize productivity. Also talked about creating a workflow for automated code reviews and abandoned a blockchain-based identity system due to complexity.",
-        "topics": [
-            {"topic": "AI task management app development", "confidence": 0.9},
-            {"topic": "automated code review workflow", "confidence": 0.8},
-            {"topic": "blockchain identity system", "confidence": 0.7}
-        ],
-        "entities": [
-            {"name": "TaskMaster AI", "type": "product_name"},
-            {"name": "CodeReviewBot", "type": "tool_name"},
-            {"name": "IdentityChain", "type": "abandoned_project"}
-        ],
-        "action_items": [
-            {"action": "Build prototype for TaskMaster AI app"},
-            {"action": "Design automated code review workflow"},
-            {"action": "Research blockchain identity solutions"}
-        ],
-        "decisions": [
-            {"decision": "Use microservices architecture for TaskMaster AI"},
-            {"decision": "Abandon blockchain identity system due to complexity"},
-            {"decision": "Create brand name 'TaskMaster AI' for the app"}
-        ]
-    }
+# Read-only so tests sharing it cannot leak changes into each other
+_SAMPLE_CONV = MappingProxyType({
+    "conversation_id": "sample_conv_001",
+    "summary": "Discussed building a new AI-powered task management app that could revolutionize productivity. Also talked about creating a workflow for automated code reviews and abandoned a blockchain-based identity system due to complexity.",
+    "topics": [
+        {"topic": "AI task management app development", "confidence": 0.9},
+        {"topic": "automated code review workflow", "confidence": 0.8},
+        {"topic": "blockchain identity system", "confidence": 0.7}
+    ],
+    "entities": [
+        {"name": "TaskMaster AI", "type": "product_name"},
+        {"name": "CodeReviewBot", "type": "tool_name"},
+        {"name": "IdentityChain", "type": "abandoned_project"}
+    ],
+    "action_items": [
+        {"action": "Build prototype for TaskMaster AI app"},
+        {"action": "Design automated code review workflow"},
+        {"action": "Research blockchain identity solutions"}
+    ],
+    "decisions": [
+        {"decision": "Use microservices architecture for TaskMaster AI"},
+        {"decision": "Abandon blockchain identity system due to complexity"},
+        {"decision": "Create brand name 'TaskMaster AI' for the app"}
+    ]
+})
+
 
+@pytest.fixture(scope="module")
+def sample_conversation():
+    """Sample conversation with IP patterns."""
+    return _SAMPLE_CONV
 
-def main():
+
+def test_ip_with_sample_data(tmp_path, monkeypatch, sample_conversation):
     """Test the IP Resurrection Engine with sample data."""
     print("🛰️ DreamVault IP Resurrection Engine Test (Sample Data)")
     print("=" * 60)
     
+    # Extracted IP is written relative to the working directory
+    monkeypatch.chdir(tmp_path)
+    
     # Initialize IP extractor
     config = {
         "paths": {
@@ -58,9 +64,6 @@ def main():
     
     ip_extractor = IPExtractor(config)
     
-    # Create sample conversation with IP patterns
-    sample_conversation = create_sample_conversation()
-    
     print("📋 Sample conversation content:")
     print(f"  Summary: {sample_conversation['summary']}")
     print(f"  Topics: {[t['topic'] for t in sample_conversation['topics']]}")
@@ -118,9 +121,24 @@ def main():
     print(f"  Abandoned ideas: {summary_stats['abandoned_ideas_count']}")
     print(f"  High-value ideas: {summary_stats['high_value_ideas_count']}")
     
+    assert summary_stats['total_conversations_analyzed'] == 1
+    assert summary_stats['total_potential_value'] == extracted_ip['potential_value']
+    
+    # Saved files name their pattern legend instead of embedding it
+    saved_ip = ip_extractor.load_extracted_ip("sample_conv_001")
+    assert "pattern_legend" not in saved_ip
+    reloaded = IPExtractor(config)
+    legend = reloaded.get_pattern_legend(saved_ip["pattern_version"])
+    for category in ("product_ideas", "workflows", "brands_names", "schemas", "abandoned_ideas"):
+        for match in saved_ip[category]:
+            assert legend[match["pattern_id"]]
+    
+    # Saves inside a batch reach the index file only when the batch ends
+    with ip_extractor.batch_index():
+        ip_extractor.save_extracted_ip(extracted_ip, "sample_conv_002")
+        index = json.loads((tmp_path / "data/resurrection/lost_inventions/index.json").read_bytes())
+        assert "sample_conv_002" not in index
+        assert ip_extractor.get_lost_inventions_summary()['total_conversations_analyzed'] == 2
+    assert IPExtractor(config).get_lost_inventions_summary()['total_conversations_analyzed'] == 2
+    
     print("\n✅ IP Resurrection Engine test completed!")
-    print("📁 Check 'data/resurrection/lost_inventions/sample_conv_001_ip.json' for extracted IP")
-
-
-if __name__ == "__main__":
-    main() 
\ No newline at end of file
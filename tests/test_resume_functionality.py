@@ -6,95 +6,113 @@ Tests the resume mechanism without requiring actual login.
 """
 
 import json
-import tempfile
 import os
+import sys
 from pathlib import Path
 
-# Add src to path for imports
-import sys
-sys.path.insert(0, str(Path(__file__).parent / "src"))
+import pytest
 
 from dreamvault.scrapers import ChatGPTScraper
 
-def test_resume_functionality():
-    """Test the resume functionality."""
-    print("🧪 Testing Resume Functionality")
-    print("=" * 50)
+TEST_CONVERSATIONS = [
+    {"id": "conv1", "title": "Test Conversation 1", "url": "https://chat.openai.com/c/conv1"},
+    {"id": "conv2", "title": "Test Conversation 2", "url": "https://chat.openai.com/c/conv2"},
+    {"id": "conv3", "title": "Test Conversation 3", "url": "https://chat.openai.com/c/conv3"}
+]
+
+
+@pytest.fixture
+def progress_file(tmp_path):
+    """Progress log private to one test."""
+    return str(tmp_path / "scraper_progress.jsonl")
+
+
+# First 2 succeed, last one fails
+@pytest.mark.parametrize("conv,success", [(c, i < 2) for i, c in enumerate(TEST_CONVERSATIONS)],
+                         ids=[c["id"] for c in TEST_CONVERSATIONS])
+def test_resume_functionality(progress_file, conv, success):
+    """Test that a processed conversation is recorded and skipped on resume."""
+    scraper = ChatGPTScraper(progress_file=progress_file)
     
-    # Create temporary progress file
-    with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-        progress_file = f.name
+    # Initial state
+    stats = scraper.get_progress_stats()
+    assert stats['total_processed'] == 0
+    assert not scraper._is_conversation_processed(conv)
+    
+    scraper._mark_conversation_processed(conv, success=success)
+    
+    # Failed conversations are still recorded, so they are skipped on resume too
+    stats = scraper.get_progress_stats()
+    assert stats['total_processed'] == 1
+    assert stats['successful'] == int(success)
+    assert stats['failed'] == int(not success)
+    assert scraper._is_conversation_processed(conv)
+    
+    # Progress file content
+    with open(progress_file, 'rb') as f:
+        progress_data = [json.loads(line) for line in f]
+    assert [(data['id'], data['success']) for data in progress_data] == [(conv['id'], success)]
+    
+    # A new scraper resumes from the progress file
+    resumed = ChatGPTScraper(progress_file=progress_file)
+    assert resumed._is_conversation_processed(conv)
+    assert resumed.get_progress_stats()['successful'] == int(success)
+
+
+def test_reset_progress(progress_file):
+    """Test that resetting forgets every processed conversation."""
+    scraper = ChatGPTScraper(progress_file=progress_file)
+    for i, conv in enumerate(TEST_CONVERSATIONS):
+        scraper._mark_conversation_processed(conv, success=i < 2)
     
-    try:
-        # Initialize scraper with temporary progress file
-        scraper = ChatGPTScraper(progress_file=progress_file)
-        
-        # Test 1: Initial state
-        print("\n📊 Test 1: Initial Progress Stats")
-        stats = scraper.get_progress_stats()
-        print(f"Total processed: {stats['total_processed']}")
-        print(f"Successful: {stats['successful']}")
-        print(f"Failed: {stats['failed']}")
-        
-        # Test 2: Mark conversations as processed
-        print("\n📝 Test 2: Marking Conversations as Processed")
-        test_conversations = [
-            {"id": "conv1", "title": "Test Conversation 1", "url": "https://chat.openai.com/c/conv1"},
-            {"id": "conv2", "title": "Test Conversation 2", "url": "https://chat.openai.com/c/conv2"},
-            {"id": "conv3", "title": "Test Conversation 3", "url": "https://chat.openai.com/c/conv3"}
-        ]
-        
-        for i, conv in enumerate(test_conversations):
-            success = i < 2  # First 2 succeed, last one fails
-            scraper._mark_conversation_processed(conv, success=success)
-            print(f"Marked conversation {conv['id']} as {'successful' if success else 'failed'}")
-        
-        # Test 3: Check updated stats
-        print("\n📊 Test 3: Updated Progress Stats")
-        stats = scraper.get_progress_stats()
-        print(f"Total processed: {stats['total_processed']}")
-        print(f"Successful: {stats['successful']}")
-        print(f"Failed: {stats['failed']}")
-        
-        # Test 4: Check if conversations are marked as processed
-        print("\n🔍 Test 4: Checking Processed Status")
-        for conv in test_conversations:
-            is_processed = scraper._is_conversation_processed(conv)
-            print(f"Conversation {conv['id']}: {'Processed' if is_processed else 'Not processed'}")
-        
-        # Test 5: Test progress file content
-        print("\n📄 Test 5: Progress File Content")
-        if os.path.exists(progress_file):
-            with open(progress_file, 'r') as f:
-                progress_data = json.load(f)
-                print(f"Progress file contains {len(progress_data)} entries")
-                for conv_hash, data in progress_data.items():
-                    print(f"  {data['id']}: {'✅' if data['success'] else '❌'}")
-        
-        # Test 6: Reset progress
-        print("\n🔄 Test 6: Reset Progress")
-        scraper.reset_progress()
-        stats = scraper.get_progress_stats()
-        print(f"After reset - Total processed: {stats['total_processed']}")
-        
-        # Test 7: Check if conversations are no longer marked as processed
-        print("\n🔍 Test 7: Checking After Reset")
-        for conv in test_conversations:
-            is_processed = scraper._is_conversation_processed(conv)
-            print(f"Conversation {conv['id']}: {'Processed' if is_processed else 'Not processed'}")
-        
-        print("\n✅ All tests passed! Resume functionality is working correctly.")
-        
-    except Exception as e:
-        print(f"❌ Test failed: {e}")
-        return False
-    finally:
-        # Clean up temporary file
-        if os.path.exists(progress_file):
-            os.unlink(progress_file)
+    stats = scraper.get_progress_stats()
+    assert (stats['total_processed'], stats['successful'], stats['failed']) == (3, 2, 1)
     
-    return True
+    scraper.reset_progress()
+    assert scraper.get_progress_stats()['total_processed'] == 0
+    assert not os.path.exists(progress_file)
+    
+    # Conversations are no longer marked as processed
+    for conv in TEST_CONVERSATIONS:
+        assert not scraper._is_conversation_processed(conv)
+
+
+
+def test_legacy_progress_migration(tmp_path):
+    """Test that an old scraper_progress.json is picked up by the .jsonl log."""
+    conv = TEST_CONVERSATIONS[0]
+    legacy = ChatGPTScraper(progress_file=str(tmp_path / "scraper_progress.jsonl"))
+    legacy_progress = {legacy._get_conversation_hash(conv): {"id": conv["id"], "success": True}}
+    (tmp_path / "scraper_progress.json").write_text(json.dumps(legacy_progress, indent=2))
+    
+    scraper = ChatGPTScraper(progress_file=str(tmp_path / "scraper_progress.jsonl"))
+    assert scraper._is_conversation_processed(conv)
+    assert (tmp_path / "scraper_progress.jsonl").exists()
+    assert not (tmp_path / "scraper_progress.json").exists()
+    
+    # A reset must not bring the migrated entries back on the next load
+    scraper.reset_progress()
+    reloaded = ChatGPTScraper(progress_file=str(tmp_path / "scraper_progress.jsonl"))
+    assert not reloaded._is_conversation_processed(conv)
+    
+    # Neither must a legacy file that reappears alongside an existing log
+    (tmp_path / "scraper_progress.json").write_text(json.dumps(legacy_progress, indent=2))
+    reloaded.reset_progress()
+    assert not (tmp_path / "scraper_progress.json").exists()
+    assert not ChatGPTScraper(progress_file=str(tmp_path / "scraper_progress.jsonl"))._is_conversation_processed(conv)
+
+
+def test_malformed_progress_lines_are_skipped(progress_file):
+    """Test that bad log lines are dropped without losing the good ones."""
+    scraper = ChatGPTScraper(progress_file=progress_file)
+    scraper._mark_conversation_processed(TEST_CONVERSATIONS[0])
+    with open(progress_file, 'a') as f:
+        f.write('{"id": "no-hash"}\n[1, 2]\n"text"\n{"hash": \n')
+    
+    resumed = ChatGPTScraper(progress_file=progress_file)
+    assert resumed.get_progress_stats()['total_processed'] == 1
+    assert resumed._is_conversation_processed(TEST_CONVERSATIONS[0])
+
 
 if __name__ == "__main__":
-    success = test_resume_functionality()
-    sys.exit(0 if success else 1) 
\ No newline at end of file
+    sys.exit(pytest.main([__file__]))
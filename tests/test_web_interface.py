@@ -0,0 +1,207 @@
+#!/usr/bin/env python3
+"""
+Test DreamVault Web Interface
+
+Exercises the web interface routes against a mocked API server.
+"""
+
+import asyncio
+import gzip
+import json
+
+import pytest
+
+httpx = pytest.importorskip("httpx")
+pytest.importorskip("flask")
+
+from dreamvault.deployment import web_interface as web
+from dreamvault.deployment.web_interface import AgentWebInterface
+
+API_URL = "http://api.test"
+MODELS = {"total_loaded": 2, "models": ["a", "b"]}
+LARGE_BODY = b"x" * (web._STREAM_THRESHOLD + 1)
+GZIPPED_BODY = gzip.compress(b'{"compressed": true}')
+
+
+def api_handler(request):
+    """Stand-in for the DreamVault API server."""
+    path = request.url.path
+    if path == "/health":
+        return httpx.Response(200, json={"status": "ok"})
+    if path == "/models":
+        return httpx.Response(200, json=MODELS)
+    if path == "/stats":
+        return httpx.Response(200, json={"requests": 1})
+    if path == "/export":
+        return httpx.Response(200, content=LARGE_BODY, headers={"Content-Type": "application/octet-stream"})
+    if path == "/encoded":
+        # An iterator keeps the body unread, as it would be off the network
+        return httpx.Response(200, content=iter([GZIPPED_BODY]), headers={
+            "Content-Type": "application/json",
+            "Content-Encoding": "gzip",
+            "Content-Length": str(len(GZIPPED_BODY)),
+        })
+    if path == "/echo":
+        return httpx.Response(200, json={
+            "content_type": request.headers.get("content-type"),
+            "body": request.content.decode("utf-8"),
+        })
+    if path == "/conversation":
+        return httpx.Response(200, text="Hello\nworld", headers={"Content-Type": "text/plain"})
+    if path == "/summarize":
+        return httpx.Response(200, json={"status": "success", "response": "short"})
+    return httpx.Response(404, json={"error": "not found"})
+
+
+def parse_events(data):
+    """Split a server-sent event stream into (event, data) pairs."""
+    events = []
+    for frame in data.decode("utf-8").split("\n\n"):
+        if not frame:
+            continue
+        event, lines = "message", []
+        for line in frame.split("\n"):
+            if line.startswith("event: "):
+                event = line[7:]
+            elif line.startswith("data: "):
+                lines.append(line[6:])
+        events.append((event, "\n".join(lines)))
+    return events
+
+
+@pytest.fixture
+def web_interface():
+    """Web interface whose proxy client talks to api_handler."""
+    interface = AgentWebInterface(api_url=API_URL)
+    interface._http.close()
+    interface._http = httpx.Client(base_url=API_URL, transport=httpx.MockTransport(api_handler))
+    yield interface
+    if interface._aclient is not None:
+        asyncio.run(interface._aclient.aclose())
+        interface._aclient = None
+    interface.stop()
+
+
+@pytest.fixture
+def client(web_interface):
+    """Flask test client for the web interface."""
+    return web_interface.app.test_client()
+
+
+def test_status_etag(client):
+    """Test that the status poller can revalidate with a 304."""
+    response = client.get("/api/status")
+    assert response.status_code == 200
+    assert json.loads(response.data) == {"api": "online", "models_loaded": 2}
+    assert response.headers["Cache-Control"] == "no-cache"
+
+    etag = response.headers["ETag"]
+    revalidated = client.get("/api/status", headers={"If-None-Match": etag})
+    assert revalidated.status_code == 304
+    assert revalidated.data == b""
+
+
+def test_proxy_caches_only_named_endpoints(client):
+    """Test that only slow-changing endpoints get caching headers."""
+    models = client.get("/api/proxy/models")
+    assert json.loads(models.data) == MODELS
+    assert models.headers["Cache-Control"] == "private, max-age=10"
+    assert client.get("/api/proxy/models", headers={"If-None-Match": models.headers["ETag"]}).status_code == 304
+
+    stats = client.get("/api/proxy/stats")
+    assert stats.status_code == 200
+    assert "ETag" not in stats.headers
+    assert "Cache-Control" not in stats.headers
+
+
+
+def test_proxy_forwards_post_body(client):
+    """Test that POST bodies reach the API server raw with their Content-Type."""
+    response = client.post("/api/proxy/echo", data="text=hi", content_type="application/x-www-form-urlencoded")
+    assert json.loads(response.data) == {"content_type": "application/x-www-form-urlencoded", "body": "text=hi"}
+
+
+def test_proxy_streams_large_bodies(client):
+    """Test that large upstream bodies are streamed rather than buffered."""
+    response = client.get("/api/proxy/export")
+    assert response.status_code == 200
+    assert response.is_streamed
+    assert response.data == LARGE_BODY
+
+
+def test_proxy_passes_encoded_bodies_through(client):
+    """Test that an already-gzipped upstream body is not recompressed."""
+    response = client.get("/api/proxy/encoded", headers={"Accept-Encoding": "gzip"})
+    assert response.headers["Content-Encoding"] == "gzip"
+    assert response.data == GZIPPED_BODY
+
+    decoded = client.get("/api/proxy/encoded")
+    assert "Content-Encoding" not in decoded.headers
+    assert json.loads(decoded.data) == {"compressed": True}
+
+
+def test_stream_agent_request(client):
+    """Test relaying agent responses as server-sent events."""
+    response = client.post("/api/stream/conversation", json={"input": "hi"})
+    assert response.mimetype == "text/event-stream"
+    assert parse_events(response.data) == [("token", "Hello\nworld"), ("done", "")]
+
+    response = client.post("/api/stream/summarize", json={"text": "long"})
+    (event, data), done = parse_events(response.data)
+    assert event == "result"
+    assert json.loads(data) == {"status": "success", "response": "short"}
+    assert done == ("done", "")
+
+
+def test_static_files_are_served_pre_gzipped(web_interface, client, tmp_path):
+    """Test gzip negotiation and revalidation for compressible static files."""
+    script = b"console.log('dreamvault');\n" * 50
+    (tmp_path / "app.js").write_bytes(script)
+    web_interface._static_dir = tmp_path
+
+    response = client.get("/static/app.js", headers={"Accept-Encoding": "gzip"})
+    assert response.headers["Content-Encoding"] == "gzip"
+    assert gzip.decompress(response.data) == script
+    assert client.get("/static/app.js", headers={
+        "Accept-Encoding": "gzip", "If-None-Match": response.headers["ETag"]
+    }).status_code == 304
+
+    plain = client.get("/static/app.js")
+    assert "Content-Encoding" not in plain.headers
+    assert plain.data == script
+    assert client.get("/static/missing.js", headers={"Accept-Encoding": "gzip"}).status_code == 404
+
+
+@pytest.mark.skipif(not web.UVICORN_AVAILABLE, reason="uvicorn/asgiref not installed")
+def test_asgi_dispatcher(web_interface):
+    """Test that the ASGI app handles proxy and status natively and defers the rest to Flask."""
+    web_interface._aclient = httpx.AsyncClient(base_url=API_URL, transport=httpx.MockTransport(api_handler))
+    app = web_interface._create_asgi_app()
+
+    async def run():
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://web.test") as asgi:
+            status = await asgi.get("/api/status")
+            assert status.json() == {"api": "online", "models_loaded": 2}
+            assert (await asgi.get("/api/status", headers={"If-None-Match": status.headers["ETag"]})).status_code == 304
+
+            models = await asgi.get("/api/proxy/models")
+            assert models.json() == MODELS
+            assert (await asgi.get("/api/proxy/models", headers={"If-None-Match": models.headers["ETag"]})).status_code == 304
+            assert "etag" not in (await asgi.get("/api/proxy/stats")).headers
+
+            echo = await asgi.post("/api/proxy/echo", content=b"plain", headers={"Content-Type": "text/plain"})
+            assert echo.json() == {"content_type": "text/plain", "body": "plain"}
+            assert (await asgi.get("/api/proxy/export")).content == LARGE_BODY
+            assert (await asgi.put("/api/proxy/models")).status_code == 405
+
+            page = await asgi.get("/")
+            assert page.status_code == 200
+            assert page.headers["content-type"].startswith("text/html")
+
+    asyncio.run(run())
+
+
+if __name__ == "__main__":
+    import sys
+    sys.exit(pytest.main([__file__]))